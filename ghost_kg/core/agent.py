@@ -13,13 +13,59 @@ Each agent maintains:
 
 import datetime
 import re
-from typing import Any, Optional, Union, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional, Union, Tuple
 
 from ..memory.fsrs import FSRS, Rating
 from ..storage.database import KnowledgeDB, NodeState
 from ..utils.time_utils import SimulationTime, parse_time_input
 from ..llm.service import LLMServiceBase
 
+# Compiled and built once at import; _normalize and _is_valid_triple run for
+# every triplet an agent learns
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+
+# 1. Stopwords / Garbage
+_STOPWORDS = frozenset({"it", "is", "the", "a", "an", "this", "that"})
+
+# 2. BANNED GRAMMATICAL TERMS (Semantic Gatekeeper)
+_BANNED_RELATIONS = frozenset({
+    "noun",
+    "verb",
+    "adjective",
+    "adverb",
+    "preposition",
+    "conjunction",
+    "pronoun",
+    "phrase",
+    "clause",
+    "sentence",
+    "statement",
+    "text",
+    "topic",
+    "concept",
+    "word",
+    "term",
+    "rating",
+    "evaluation",
+    "opinion",
+})
+
+# 3. BANNED GENERIC NODES
+_BANNED_NODES = frozenset({
+    "text",
+    "entity",
+    "author",
+    "none",
+    "unknown",
+    "wikipedia",
+    "general knowledge",
+    "source",
+    "target",
+    "adjective",
+    "noun",
+})
+
 
 class GhostAgent:
     """
@@ -38,10 +84,12 @@ class GhostAgent:
         fsrs (FSRS): Memory scheduler for tracking concept strength
         llm_service (Optional[LLMServiceBase]): Unified LLM service for any provider
         current_time (SimulationTime): Simulation clock for temporal tracking
+        revision (int): Counter bumped on every write to the agent's graph
 
     Methods:
         set_time: Update simulation clock (accepts datetime or (day, hour) tuple)
         learn_triplet: Add new knowledge triplet to graph
+        learn_triplets: Add many triplets in one batch
         update_memory: Update memory strength of a concept
         get_memory_view: Retrieve agent's knowledge about a topic
     """
@@ -52,6 +100,7 @@ class GhostAgent:
         db_path: str = "agent_memory.db",
         store_log_content: bool = False,
         llm_service: Optional[LLMServiceBase] = None,
+        db: Optional[KnowledgeDB] = None,
     ) -> None:
         """
         Initialize a new GhostAgent.
@@ -64,12 +113,17 @@ class GhostAgent:
             llm_service (Optional[LLMServiceBase]): LLM service instance for any provider
                                                      (Ollama, OpenAI, Anthropic, etc.).
                                                      Optional - only needed if using CognitiveLoop.
+            db (Optional[KnowledgeDB]): Existing database to use instead of opening
+                                        a new one; db_path and store_log_content
+                                        are ignored when given.
 
         Returns:
             None
         """
         self.name = name
-        self.db = KnowledgeDB(db_path, store_log_content=store_log_content)
+        if db is None:
+            db = KnowledgeDB(db_path, store_log_content=store_log_content)
+        self.db = db
         self.fsrs = FSRS()
         self.llm_service = llm_service
 
@@ -78,6 +132,7 @@ class GhostAgent:
             datetime.datetime.now(datetime.timezone.utc)
         )
         self.db.upsert_node(self.name, "I", timestamp=self.current_time)
+        self.revision = 0
 
     def set_time(
         self, new_time: Union[datetime.datetime, Tuple[int, int], SimulationTime]
@@ -119,15 +174,14 @@ class GhostAgent:
         """
         if not text:
             return None
-        clean = text.strip().lower()
-        clean = re.sub(r"[^a-z0-9\s]", "", clean)
+        clean = _NON_ALNUM.sub("", text.strip().lower())
 
         # Handle explicit self-references
         if clean == "i":
             return "I"
         if clean == self.name.lower():
             return "I"
-        if clean in ["me", "myself"]:
+        if clean in ("me", "myself"):
             return "I"
 
         return clean
@@ -150,47 +204,6 @@ class GhostAgent:
         Returns:
             bool: True if triplet is semantically meaningful
         """
-        # 1. Stopwords / Garbage
-        stopwords = {"it", "is", "the", "a", "an", "this", "that"}
-
-        # 2. BANNED GRAMMATICAL TERMS (Semantic Gatekeeper)
-        banned_relations = {
-            "noun",
-            "verb",
-            "adjective",
-            "adverb",
-            "preposition",
-            "conjunction",
-            "pronoun",
-            "phrase",
-            "clause",
-            "sentence",
-            "statement",
-            "text",
-            "topic",
-            "concept",
-            "word",
-            "term",
-            "rating",
-            "evaluation",
-            "opinion",
-        }
-
-        # 3. BANNED GENERIC NODES
-        banned_nodes = {
-            "text",
-            "entity",
-            "author",
-            "none",
-            "unknown",
-            "wikipedia",
-            "general knowledge",
-            "source",
-            "target",
-            "adjective",
-            "noun",
-        }
-
         if not src or not rel or not tgt:
             return False
 
@@ -200,11 +213,11 @@ class GhostAgent:
         if len(tgt) < 2 and tgt != "I":
             return False
 
-        if src in stopwords or tgt in stopwords:
+        if src in _STOPWORDS or tgt in _STOPWORDS:
             return False
-        if src in banned_nodes or tgt in banned_nodes:
+        if src in _BANNED_NODES or tgt in _BANNED_NODES:
             return False
-        if rel in banned_relations:
+        if rel in _BANNED_RELATIONS:
             return False
 
         return True
@@ -224,34 +237,46 @@ class GhostAgent:
         if not norm_name:
             return
 
-        row = self.db.get_node(self.name, norm_name)
-        if row and row["last_review"]:
-            last_review = row["last_review"]
-            if isinstance(last_review, str):
-                try:
-                    last_review = datetime.datetime.fromisoformat(last_review)
-                except (ValueError, TypeError):
-                    # Use a datetime default even in round mode
-                    last_review = (
-                        self.current_time.to_datetime()
-                        if self.current_time.is_datetime_mode()
-                        else datetime.datetime.now(datetime.timezone.utc)
-                    )
-            if last_review and last_review.tzinfo is None:
-                last_review = last_review.replace(tzinfo=datetime.timezone.utc)
-            current = NodeState(
-                row["stability"],
-                row["difficulty"],
-                last_review,
-                row["reps"],
-                row["state"],
-            )
-        else:
-            current = NodeState(0, 0, None, 0, 0)
+        current = self._node_state(self.db.get_node(self.name, norm_name))
 
         # Use Simulation Time
         new_state = self.fsrs.calculate_next(current, rating, self.current_time)
         self.db.upsert_node(self.name, norm_name, new_state, timestamp=self.current_time)
+        self.revision += 1
+
+    def _node_state(self, row: Optional[Dict[str, Any]]) -> NodeState:
+        """
+        Build the FSRS state of a node from its database row.
+
+        Args:
+            row (Optional[Dict[str, Any]]): Node row as returned by KnowledgeDB.get_node
+
+        Returns:
+            NodeState: Stored state, or a fresh state if the node was never reviewed
+        """
+        if not row or not row["last_review"]:
+            return NodeState(0, 0, None, 0, 0)
+
+        last_review = row["last_review"]
+        if isinstance(last_review, str):
+            try:
+                last_review = datetime.datetime.fromisoformat(last_review)
+            except (ValueError, TypeError):
+                # Use a datetime default even in round mode
+                last_review = (
+                    self.current_time.to_datetime()
+                    if self.current_time.is_datetime_mode()
+                    else datetime.datetime.now(datetime.timezone.utc)
+                )
+        if last_review and last_review.tzinfo is None:
+            last_review = last_review.replace(tzinfo=datetime.timezone.utc)
+        return NodeState(
+            row["stability"],
+            row["difficulty"],
+            last_review,
+            row["reps"],
+            row["state"],
+        )
 
     def learn_triplet(
         self,
@@ -320,6 +345,67 @@ class GhostAgent:
             sentiment=sentiment,
             timestamp=self.current_time,
         )
+        self.revision += 1
+
+    def learn_triplets(
+        self,
+        triplets: Iterable[Tuple[Any, ...]],
+        rating: Optional[int] = None,
+    ) -> None:
+        """
+        Add many knowledge triplets to the agent's knowledge graph at once.
+
+        Produces the same graph and FSRS states as calling learn_triplet() for
+        each triplet in order, but reads the affected nodes with one query and
+        writes nodes and edges in bulk instead of several round trips per
+        triplet.
+
+        Args:
+            triplets (Iterable[Tuple[Any, ...]]): ``(source, relation, target)`` or
+                ``(source, relation, target, sentiment)`` tuples
+            rating (Optional[int]): Memory strength rating (1-4) applied to every
+                target. Defaults to Rating.Good
+
+        Returns:
+            None
+
+        Raises:
+            ValidationError: If a sentiment is outside [-1.0, 1.0]
+        """
+        if rating is None:
+            rating = Rating.Good
+
+        relations = []
+        reviews = []
+        for source, relation, target, *rest in triplets:
+            sentiment = rest[0] if rest and rest[0] is not None else 0.0
+            n_source = self._normalize(source)
+            n_target = self._normalize(target)
+            n_relation = self._normalize(relation)
+
+            if not self._is_valid_triple(n_source, n_relation, n_target):  # type: ignore[arg-type]
+                continue  # Silent rejection of garbage
+
+            relations.append((n_source, n_relation, n_target, sentiment))
+            # Same review order as learn_triplet: target first, then source
+            reviews.append((n_target, rating))
+            if n_source != "I":
+                reviews.append((n_source, Rating.Good))
+
+        if not relations:
+            return
+
+        # Edges first: this validates every sentiment before any state is written
+        self.db.add_relations_bulk(self.name, relations, timestamp=self.current_time)
+
+        rows = self.db.get_nodes(self.name, (name for name, _ in reviews))
+        states: Dict[str, NodeState] = {}
+        for name, review_rating in reviews:
+            current = states[name] if name in states else self._node_state(rows.get(name))
+            states[name] = self.fsrs.calculate_next(current, review_rating, self.current_time)
+
+        self.db.upsert_nodes_bulk(self.name, states, timestamp=self.current_time)
+        self.revision += 1
 
     def _get_retrievability(
         self, stability: float, last_review: Optional[datetime.datetime]
@@ -442,9 +528,9 @@ class GhostAgent:
             parts.append("MY CURRENT STANCE: (I have no strong opinion yet).")
 
         if world_facts:
-            parts.append(f"KNOWN FACTS: {'; '.join(list(world_facts.keys())[:5])}.")
+            parts.append(f"KNOWN FACTS: {'; '.join(islice(world_facts, 5))}.")
         if others_beliefs:
-            parts.append(f"WHAT OTHERS THINK: {'; '.join(list(others_beliefs.keys())[:3])}.")
+            parts.append(f"WHAT OTHERS THINK: {'; '.join(islice(others_beliefs, 3))}.")
 
         return " ".join(parts)
 
@@ -166,55 +166,56 @@ class CognitiveLoop:
         # Extract triplets using configured extractor
         data = self.extractor.extract(text, author, self.agent.name)
 
-        # Process extracted triplets
-        for item in data.get("world_facts", []):
-            source = item.get("source", "")
-            relation = item.get("relation", "")
-            target = item.get("target", "")
+        # Store every extracted triplet and the log entry in one transaction
+        with self.agent.db.transaction():
+            for item in data.get("world_facts", []):
+                source = item.get("source", "")
+                relation = item.get("relation", "")
+                target = item.get("target", "")
             
-            # Skip malformed triplets missing required fields
-            if not source or not relation or not target:
-                print(f"   ! Skipping malformed world_fact triplet: {item}")
-                continue
+                # Skip malformed triplets missing required fields
+                if not source or not relation or not target:
+                    print(f"   ! Skipping malformed world_fact triplet: {item}")
+                    continue
                 
-            self.agent.learn_triplet(source, relation, target)
+                self.agent.learn_triplet(source, relation, target)
 
-        for item in data.get("partner_stance", []):
-            source = item.get("source", "")
-            relation = item.get("relation", "")
-            target = item.get("target", "")
-            sentiment = self._clamp_sentiment(item.get("sentiment", 0.0))
+            for item in data.get("partner_stance", []):
+                source = item.get("source", "")
+                relation = item.get("relation", "")
+                target = item.get("target", "")
+                sentiment = self._clamp_sentiment(item.get("sentiment", 0.0))
             
-            # Skip malformed triplets missing required fields
-            if not source or not relation or not target:
-                print(f"   ! Skipping malformed partner_stance triplet: {item}")
-                continue
+                # Skip malformed triplets missing required fields
+                if not source or not relation or not target:
+                    print(f"   ! Skipping malformed partner_stance triplet: {item}")
+                    continue
                 
-            self.agent.learn_triplet(source, relation, target, sentiment=sentiment)
+                self.agent.learn_triplet(source, relation, target, sentiment=sentiment)
 
-        for item in data.get("my_reaction", []):
-            relation = item.get("relation", "")
-            target = item.get("target", "")
-            s_score = self._clamp_sentiment(item.get("sentiment", 0.0))
-            rating = item.get("rating", Rating.Good)
+            for item in data.get("my_reaction", []):
+                relation = item.get("relation", "")
+                target = item.get("target", "")
+                s_score = self._clamp_sentiment(item.get("sentiment", 0.0))
+                rating = item.get("rating", Rating.Good)
             
-            # Skip malformed triplets missing required fields
-            if not relation or not target:
-                print(f"   ! Skipping malformed my_reaction triplet: {item}")
-                continue
+                # Skip malformed triplets missing required fields
+                if not relation or not target:
+                    print(f"   ! Skipping malformed my_reaction triplet: {item}")
+                    continue
                 
-            self.agent.learn_triplet(
-                "I",
-                relation,
-                target,
-                rating=rating,
-                sentiment=s_score,
-            )
+                self.agent.learn_triplet(
+                    "I",
+                    relation,
+                    target,
+                    rating=rating,
+                    sentiment=s_score,
+                )
 
-        # Log the interaction
-        self.agent.db.log_interaction(
-            self.agent.name, "READ", text, data, timestamp=self.agent.current_time
-        )
+            # Log the interaction
+            self.agent.db.log_interaction(
+                self.agent.name, "READ", text, data, timestamp=self.agent.current_time
+            )
 
         # Print summary for LLM mode
         if not self.fast_mode:
@@ -6,10 +6,11 @@ with individual agent Knowledge Graphs without handling the LLM logic.
 """
 
 import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .agent import GhostAgent
 from ..utils.exceptions import AgentNotFoundError, ValidationError
+from ..memory.cache import AgentCache
 from ..memory.fsrs import Rating
 from ..storage.database import KnowledgeDB
 from ..llm.service import LLMServiceBase
@@ -25,10 +26,18 @@ class AgentManager:
     - Retrieve context for generating responses
     - Update agent KGs with generated responses
     - Control time for each interaction
+
+    Contexts returned by get_context() are cached per agent and topic until
+    the agent's graph changes or its clock moves. Changes made to the database
+    without going through the agents (raw SQL, another process) are not seen
+    by the cache; pass context_cache_size=0 to disable it in that case.
     """
 
     def __init__(
-        self, db_path: str = "agent_memory.db", store_log_content: bool = False
+        self,
+        db_path: str = "agent_memory.db",
+        store_log_content: bool = False,
+        context_cache_size: int = 256,
     ) -> None:
         """
         Initialize the AgentManager.
@@ -37,6 +46,8 @@ class AgentManager:
             db_path (str): Path to the SQLite database file
             store_log_content (bool): If True, stores full content in log table.
                                      If False (default), stores UUID instead of content.
+            context_cache_size (int): Number of get_context() results to keep
+                                      cached (default: 256, 0 disables caching)
 
         Returns:
             None
@@ -45,6 +56,9 @@ class AgentManager:
         self.store_log_content = store_log_content
         self.agents: Dict[str, GhostAgent] = {}
         self.db = KnowledgeDB(db_path, store_log_content=store_log_content)
+        self.context_cache = AgentCache(
+            max_size=context_cache_size, enabled=context_cache_size > 0
+        )
 
     def create_agent(
         self, 
@@ -69,14 +83,54 @@ class AgentManager:
             raise ValidationError("Agent name must be a non-empty string")
 
         if name not in self.agents:
+            # Agents share the manager's database, so one transaction()
+            # covers both their graph writes and the manager's logs
             self.agents[name] = GhostAgent(
                 name,
-                db_path=self.db_path,
-                store_log_content=self.store_log_content,
                 llm_service=llm_service,
+                db=self.db,
             )
         return self.agents[name]
 
+    def create_agents_bulk(
+        self, specs: List[Tuple[str, Optional[datetime.datetime]]]
+    ) -> List[GhostAgent]:
+        """
+        Create or retrieve several agents and set their clocks in one transaction.
+
+        Equivalent to calling create_agent() and set_agent_time() for each
+        spec, but the agents' initial nodes are committed together.
+
+        Args:
+            specs (List[Tuple[str, Optional[datetime.datetime]]]): ``(name, time)``
+                pairs; a time of None keeps the agent's current clock
+
+        Returns:
+            List[GhostAgent]: The agents, in the order of ``specs``
+
+        Raises:
+            ValidationError: If a name or time is invalid
+        """
+        for name, time in specs:
+            if not name or not isinstance(name, str):
+                raise ValidationError("Agent name must be a non-empty string")
+            if time is not None and not isinstance(time, datetime.datetime):
+                raise ValidationError("time must be a datetime object")
+
+        new_names = [name for name, _ in specs if name not in self.agents]
+        try:
+            with self.db.transaction():
+                agents = [self.create_agent(name) for name, _ in specs]
+        except Exception:
+            # Their "I" nodes were rolled back, so do not keep the agents either
+            for name in new_names:
+                self.agents.pop(name, None)
+            raise
+        for agent, (_, time) in zip(agents, specs):
+            if time is not None:
+                agent.set_time(time)
+        return agents
+
     def get_agent(self, name: str) -> Optional[GhostAgent]:
         """
         Get an existing agent.
@@ -110,6 +164,9 @@ class AgentManager:
         agent = self.get_agent(agent_name)
         if not agent:
             raise AgentNotFoundError(f"Agent '{agent_name}' not found")
+        # Re-setting the same time (e.g. once per interaction) changes nothing
+        if agent.current_time == time:
+            return
         agent.set_time(time)
 
     def absorb_content(
@@ -172,18 +229,10 @@ class AgentManager:
             raise AgentNotFoundError(f"Agent '{agent_name}' not found")
 
         if triplets:
-            # Validate triplets
-            if not isinstance(triplets, list):
-                raise ValidationError("triplets must be a list")
-            for triplet in triplets:
-                if not isinstance(triplet, (tuple, list)) or len(triplet) != 3:
-                    raise ValidationError(
-                        "Each triplet must be a 3-tuple (source, relation, target)"
-                    )
+            self._validate_triplets(triplets, "(source, relation, target)")
 
             # External program provides triplets
-            for source, relation, target in triplets:
-                agent.learn_triplet(source, relation, target, rating=Rating.Good)
+            agent.learn_triplets(triplets, rating=Rating.Good)
 
             # Log the interaction
             self.db.log_interaction(
@@ -200,6 +249,68 @@ class AgentManager:
             loop = CognitiveLoop(agent, fast_mode=fast_mode)
             loop.absorb(content, author=author)
 
+    def absorb_content_bulk(
+        self,
+        agent_name: str,
+        items: List[Tuple[str, str, List[Tuple[str, str, str]]]],
+    ) -> None:
+        """
+        Update agent's KG with many pieces of content in one batch.
+
+        Equivalent to calling absorb_content() with external triplets for each
+        item in order, but all triplets are learned through a single
+        GhostAgent.learn_triplets() call, so node and edge writes are batched
+        instead of issued per triplet.
+
+        Args:
+            agent_name (str): Name of the agent
+            items (List[Tuple[str, str, List[Tuple[str, str, str]]]]): List of
+                (content, author, triplets) tuples. Every item must provide its
+                (source, relation, target) triplets; internal extraction is not
+                available in bulk mode.
+
+        Returns:
+            None
+
+        Raises:
+            AgentNotFoundError: If agent doesn't exist
+            ValidationError: If parameters are invalid
+
+        See Also:
+            - absorb_content(): Absorb a single piece of content
+        """
+        agent = self.get_agent(agent_name)
+        if not agent:
+            raise AgentNotFoundError(f"Agent '{agent_name}' not found")
+
+        if not isinstance(items, list):
+            raise ValidationError("items must be a list")
+        for item in items:
+            if not isinstance(item, (tuple, list)) or len(item) != 3:
+                raise ValidationError("Each item must be a 3-tuple (content, author, triplets)")
+            content, author, triplets = item
+            if not content or not isinstance(content, str):
+                raise ValidationError("content must be a non-empty string")
+            if not author or not isinstance(author, str):
+                raise ValidationError("author must be a non-empty string")
+            if not triplets:
+                raise ValidationError("triplets are required for bulk absorption")
+            self._validate_triplets(triplets, "(source, relation, target)")
+
+        agent.learn_triplets(
+            [triplet for _, _, triplets in items for triplet in triplets],
+            rating=Rating.Good,
+        )
+
+        for content, author, triplets in items:
+            self.db.log_interaction(
+                agent_name,
+                "READ",
+                content,
+                {"author": author, "triplets_count": len(triplets), "external": True},
+                timestamp=agent.current_time,
+            )
+
     def get_context(self, agent_name: str, topic: str) -> str:
         """
         Get all context to be used when the agent replies to content on a topic.
@@ -240,7 +351,19 @@ class AgentManager:
         if not agent:
             raise AgentNotFoundError(f"Agent '{agent_name}' not found")
 
-        return agent.get_memory_view(topic)
+        # Uncommitted writes may still be rolled back, so only cache outside transactions
+        if self.db.in_transaction:
+            return agent.get_memory_view(topic)
+
+        # The view depends on the graph (revision) and on the clock (retrievability).
+        # The commit epoch is read first, so a view built while another thread's
+        # transaction was still open is never served once that transaction ends.
+        version = (self.db.commit_epoch, agent.revision, str(agent.current_time))
+        context = self.context_cache.get_context(agent_name, topic, version)
+        if context is None:
+            context = agent.get_memory_view(topic)
+            self.context_cache.put_context(agent_name, topic, context, version)
+        return context
 
     def process_and_get_context(
         self,
@@ -341,14 +464,7 @@ class AgentManager:
             raise ValueError(f"Agent '{agent_name}' not found")
 
         if triplets:
-            # Validate triplets
-            if not isinstance(triplets, list):
-                raise ValidationError("triplets must be a list")
-            for triplet in triplets:
-                if not isinstance(triplet, (tuple, list)) or len(triplet) != 3:
-                    raise ValidationError(
-                        "Each triplet must be a 3-tuple (relation, target, sentiment)"
-                    )
+            self._validate_triplets(triplets, "(relation, target, sentiment)")
 
             # External program provides triplets (source is always "I")
             for relation, target, sentiment in triplets:
@@ -418,6 +534,101 @@ class AgentManager:
 
         agent.learn_triplet(source, relation, target, rating=rating, sentiment=sentiment)
 
+    def learn_triplets(
+        self,
+        agent_name: str,
+        triplets: List[Tuple[Any, ...]],
+        rating: int = Rating.Good,
+    ) -> None:
+        """
+        Directly add many triplets to an agent's KG in one batch.
+
+        Produces the same graph as calling learn_triplet() for each triplet in
+        order, but the affected nodes are read with one query and nodes and
+        edges are written in bulk.
+
+        Args:
+            agent_name (str): Name of the agent
+            triplets (List[Tuple[Any, ...]]): ``(source, relation, target)`` or
+                ``(source, relation, target, sentiment)`` tuples
+            rating (int): FSRS rating (1-4, see Rating class) applied to every target
+
+        Returns:
+            None
+
+        Raises:
+            AgentNotFoundError: If agent doesn't exist
+            ValidationError: If triplets are malformed or a sentiment is out of range
+        """
+        agent = self.get_agent(agent_name)
+        if not agent:
+            raise AgentNotFoundError(f"Agent '{agent_name}' not found")
+
+        self._validate_triplets(
+            triplets, "(source, relation, target[, sentiment])", sizes=(3, 4)
+        )
+
+        agent.learn_triplets(triplets, rating=rating)
+
+    def ingest_triplets_raw(
+        self, agent_name: str, triplets: List[Tuple[Any, ...]]
+    ) -> None:
+        """
+        Write triplets straight into an agent's KG without any processing.
+
+        Unlike learn_triplet() and absorb_content(), the triplets are stored
+        exactly as given: there is no normalization, no stopword filtering,
+        no FSRS review of the nodes and no interaction log entry. Missing
+        nodes are created with a fresh memory state. Use this to load
+        pre-cleaned data (e.g. a dataset import) as fast as possible.
+
+        Args:
+            agent_name (str): Name of the agent
+            triplets (List[Tuple[Any, ...]]): ``(source, relation, target)`` or
+                ``(source, relation, target, sentiment)`` tuples
+
+        Returns:
+            None
+
+        Raises:
+            AgentNotFoundError: If agent doesn't exist
+            ValidationError: If parameters are invalid
+            DatabaseError: If database operation fails
+        """
+        agent = self.get_agent(agent_name)
+        if not agent:
+            raise AgentNotFoundError(f"Agent '{agent_name}' not found")
+
+        self._validate_triplets(
+            triplets, "(source, relation, target[, sentiment])", sizes=(3, 4)
+        )
+
+        agent.db.add_relations_bulk(agent_name, triplets, timestamp=agent.current_time)
+        agent.revision += 1
+
+    @staticmethod
+    def _validate_triplets(
+        triplets: List[Tuple], shape: str, sizes: Tuple[int, ...] = (3,)
+    ) -> None:
+        """
+        Check that triplets is a list of tuples of an accepted length.
+
+        Args:
+            triplets (List[Tuple]): Triplets supplied by the caller
+            shape (str): Expected tuple layout, used in the error message
+            sizes (Tuple[int, ...]): Accepted tuple lengths (default: 3 only)
+
+        Raises:
+            ValidationError: If triplets are malformed
+        """
+        if not isinstance(triplets, list):
+            raise ValidationError("triplets must be a list")
+        for triplet in triplets:
+            if not isinstance(triplet, (tuple, list)) or len(triplet) not in sizes:
+                if sizes == (3,):
+                    raise ValidationError(f"Each triplet must be a 3-tuple {shape}")
+                raise ValidationError(f"Each triplet must be a {shape} tuple")
+
     def get_agent_knowledge(self, agent_name: str, topic: Optional[str] = None) -> Dict:
         """
         Retrieve agent's knowledge graph information.
@@ -12,32 +12,34 @@ import json
 import threading
 import time
 from abc import ABC, abstractmethod
+from importlib.util import find_spec
 from typing import Any, Dict, Optional, Union
 
 from ghost_kg.utils.exceptions import LLMError
 from ghost_kg.llm.service import LLMServiceBase
 
-# Optional dependencies for fast mode
-try:
-    from gliner import GLiNER
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-    HAS_FAST_MODE = True
-except ImportError:
-    GLiNER = None
-    SentimentIntensityAnalyzer = None
-    HAS_FAST_MODE = False
+# Optional dependencies for fast mode. They are only located here; GLiNER pulls
+# in torch and transformers, so the packages are imported by ModelCache on the
+# first fast-mode extraction rather than whenever ghost_kg is imported. An
+# installed package that fails to import is reported by ModelCache with the same
+# message as a missing one.
+HAS_FAST_MODE = find_spec("gliner") is not None and find_spec("vaderSentiment") is not None
+_FAST_MODE_MISSING = (
+    "Fast mode requires 'gliner' and 'vaderSentiment'. "
+    "Install with: pip install gliner vaderSentiment"
+)
 
 
 class ModelCache:
     """
-    Thread-safe cache for GLiNER model.
+    Thread-safe cache for the fast-mode models (GLiNER and the VADER analyzer).
 
     Prevents multiple loads of the same model and ensures thread safety.
     """
 
     _lock = threading.Lock()
     _model = None
+    _sentiment_analyzer = None
 
     @classmethod
     def get_gliner_model(cls) -> Optional[Any]:
@@ -46,6 +48,9 @@ class ModelCache:
 
         Returns:
             Optional[Any]: GLiNER model instance or None if unavailable
+
+        Raises:
+            ImportError: If gliner is installed but cannot be imported
         """
         if not HAS_FAST_MODE:
             return None
@@ -54,10 +59,44 @@ class ModelCache:
             with cls._lock:
                 # Double-check pattern
                 if cls._model is None:
+                    try:
+                        from gliner import GLiNER
+                    except ImportError as e:
+                        raise ImportError(_FAST_MODE_MISSING) from e
+
                     print("⚡ [Fast Mode] Loading GLiNER model...")
                     cls._model = GLiNER.from_pretrained("urchade/gliner_small-v2.1")
         return cls._model
 
+    @classmethod
+    def get_sentiment_analyzer(cls) -> Optional[Any]:
+        """
+        Get or create the VADER sentiment analyzer (thread-safe).
+
+        Building the analyzer parses the VADER lexicon; scoring keeps no state,
+        so one instance is shared by every FastExtractor.
+
+        Returns:
+            Optional[Any]: SentimentIntensityAnalyzer instance or None if unavailable
+
+        Raises:
+            ImportError: If vaderSentiment is installed but cannot be imported
+        """
+        if not HAS_FAST_MODE:
+            return None
+
+        if cls._sentiment_analyzer is None:
+            with cls._lock:
+                # Double-check pattern
+                if cls._sentiment_analyzer is None:
+                    try:
+                        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+                    except ImportError as e:
+                        raise ImportError(_FAST_MODE_MISSING) from e
+
+                    cls._sentiment_analyzer = SentimentIntensityAnalyzer()
+        return cls._sentiment_analyzer
+
 
 class TripletExtractor(ABC):
     """Abstract base class for triplet extraction strategies."""
@@ -99,12 +138,9 @@ class FastExtractor(TripletExtractor):
             ImportError: If required dependencies are not installed
         """
         if not HAS_FAST_MODE:
-            raise ImportError(
-                "Fast mode requires 'gliner' and 'vaderSentiment'. "
-                "Install with: pip install gliner vaderSentiment"
-            )
+            raise ImportError(_FAST_MODE_MISSING)
         self.model = ModelCache.get_gliner_model()
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()  # type: ignore[misc]
+        self.sentiment_analyzer = ModelCache.get_sentiment_analyzer()
 
     def extract(self, text: str, author: str, agent_name: str) -> Dict[str, Any]:
         """
@@ -398,10 +434,7 @@ def get_extractor(
     """
     if fast_mode:
         if not HAS_FAST_MODE:
-            raise ImportError(
-                "Fast mode requires 'gliner' and 'vaderSentiment'. "
-                "Install with: pip install gliner vaderSentiment"
-            )
+            raise ImportError(_FAST_MODE_MISSING)
         return FastExtractor()
     else:
         if llm_service is None:
@@ -9,19 +9,112 @@ import hashlib
 import json
 import threading
 from functools import lru_cache
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _digest(args: Tuple[Any, ...]) -> str:
+    """Hash a tuple of key components into a stable hex digest."""
+    key_str = json.dumps(args, sort_keys=True, default=str)
+    return hashlib.md5(key_str.encode()).hexdigest()
+
+
+# Lookups repeat the same (kind, agent, topic) tuples, so memoize the
+# JSON encoding + md5 of hashable keys at C level.
+_cached_digest = lru_cache(maxsize=1024)(_digest)
+
+
+class _ClockStore:
+    """
+    Fixed-capacity key/value store with frequency-counting CLOCK eviction.
+
+    Entries live in a ring of slots, each with a small access counter. A hit
+    only bumps its slot's counter, so reads never reorder anything and need
+    no lock. When the ring is full, a hand sweeps the slots, decrementing
+    non-zero counters, and replaces the first entry whose counter is already
+    zero. Counters saturate at MAX_FREQ, so an entry hit repeatedly survives
+    up to that many sweeps while one-off entries are evicted on the first.
+    Writers must be serialized by the caller.
+    """
+
+    MAX_FREQ = 3
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._slots: List[Tuple[str, Any]] = []
+        self._ref: List[int] = []
+        self._index: Dict[str, int] = {}
+        self._hand = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key (marking it referenced) or None."""
+        slot = self._index.get(key)
+        if slot is None:
+            return None
+        try:
+            entry = self._slots[slot]
+            # The slot may have been reused by a concurrent put
+            if entry[0] != key:
+                return None
+            # Racing hits may lose an increment; the counter is only a hint
+            if self._ref[slot] < self.MAX_FREQ:
+                self._ref[slot] += 1
+        except IndexError:
+            # Cleared concurrently
+            return None
+        return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """Insert or overwrite key, evicting one entry if the ring is full."""
+        slot = self._index.get(key)
+        if slot is not None:
+            self._slots[slot] = (key, value)
+            if self._ref[slot] < self.MAX_FREQ:
+                self._ref[slot] += 1
+            return
+        if self._capacity <= 0:
+            return
+
+        if len(self._slots) < self._capacity:
+            self._slots.append((key, value))
+            self._ref.append(0)
+            self._index[key] = len(self._slots) - 1
+            return
+
+        # Age referenced entries until an unreferenced one turns up; this takes
+        # at most MAX_FREQ + 1 turns of the hand
+        while self._ref[self._hand]:
+            self._ref[self._hand] -= 1
+            self._hand = (self._hand + 1) % self._capacity
+        slot = self._hand
+        del self._index[self._slots[slot][0]]
+        self._slots[slot] = (key, value)
+        self._ref[slot] = 0
+        self._index[key] = slot
+        self._hand = (slot + 1) % self._capacity
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._slots = []
+        self._ref = []
+        self._index = {}
+        self._hand = 0
 
 
 class AgentCache:
     """
-    Thread-safe cache for agent data with LRU eviction.
+    Thread-safe cache for agent data with approximate-LRU eviction.
 
     This cache stores frequently accessed data like context retrievals,
     memory views, and query results to reduce database load and improve
     response times.
 
-    The cache is thread-safe and uses LRU (Least Recently Used) eviction
-    when it reaches max_size.
+    The cache is thread-safe and uses frequency-counting CLOCK eviction, an
+    approximation of LRU (Least Recently Used) that favours entries hit more
+    than once, when it reaches max_size. Cache hits do not take the lock;
+    writes are serialized.
 
     Attributes:
         max_size: Maximum number of entries to cache
@@ -44,10 +137,9 @@ class AgentCache:
         """
         self.max_size = max_size
         self.enabled = enabled
-        self._context_cache: Dict[str, Tuple[str, int]] = {}  # key -> (value, access_count)
-        self._memory_cache: Dict[str, Tuple[Any, int]] = {}
+        self._context_cache = _ClockStore(max_size)
+        self._memory_cache = _ClockStore(max_size)
         self._lock = threading.Lock()
-        self._access_counter = 0
 
     def _make_key(self, *args) -> str:
         """
@@ -59,31 +151,23 @@ class AgentCache:
         Returns:
             str: Hash string for cache key
         """
-        key_str = json.dumps(args, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
-
-    def _evict_lru(self, cache: Dict[str, Tuple[Any, int]]) -> None:
-        """
-        Evict least recently used entry from cache.
-
-        Args:
-            cache (Dict[str, Tuple[Any, int]]): The cache dict to evict from
-
-        Returns:
-            None
-        """
-        if len(cache) >= self.max_size:
-            # Find entry with lowest access count
-            lru_key = min(cache.items(), key=lambda x: x[1][1])[0]
-            del cache[lru_key]
-
-    def get_context(self, agent_name: str, topic: str) -> Optional[str]:
+        try:
+            return _cached_digest(args)
+        except TypeError:
+            # Unhashable component (e.g. a list topic); hash without memoizing
+            return _digest(args)
+
+    def get_context(
+        self, agent_name: str, topic: str, version: Optional[Any] = None
+    ) -> Optional[str]:
         """
         Get cached context for agent and topic.
 
         Args:
             agent_name (str): Name of the agent
             topic (str): Topic keyword
+            version (Optional[Any]): Optional version stamp; entries cached
+                under a different version are not returned
 
         Returns:
             Optional[str]: Cached context string or None if not found
@@ -91,16 +175,11 @@ class AgentCache:
         if not self.enabled:
             return None
 
-        key = self._make_key("context", agent_name, topic)
-        with self._lock:
-            if key in self._context_cache:
-                value, _ = self._context_cache[key]
-                self._access_counter += 1
-                self._context_cache[key] = (value, self._access_counter)
-                return value
-        return None
-
-    def put_context(self, agent_name: str, topic: str, context: str) -> None:
+        return self._context_cache.get(self._make_key("context", agent_name, topic, version))
+
+    def put_context(
+        self, agent_name: str, topic: str, context: str, version: Optional[Any] = None
+    ) -> None:
         """
         Cache context for agent and topic.
 
@@ -108,6 +187,7 @@ class AgentCache:
             agent_name (str): Name of the agent
             topic (str): Topic keyword
             context (str): Context string to cache
+            version (Optional[Any]): Optional version stamp the context was built at
 
         Returns:
             None
@@ -115,13 +195,9 @@ class AgentCache:
         if not self.enabled:
             return
 
-        key = self._make_key("context", agent_name, topic)
+        key = self._make_key("context", agent_name, topic, version)
         with self._lock:
-            # Only evict if adding a NEW entry would exceed max_size
-            if key not in self._context_cache and len(self._context_cache) >= self.max_size:
-                self._evict_lru(self._context_cache)
-            self._access_counter += 1
-            self._context_cache[key] = (context, self._access_counter)
+            self._context_cache.put(key, context)
 
     def get_memory_view(
         self, agent_name: str, topic: Optional[str] = None, time_filter: Optional[str] = None
@@ -140,14 +216,7 @@ class AgentCache:
         if not self.enabled:
             return None
 
-        key = self._make_key("memory", agent_name, topic, time_filter)
-        with self._lock:
-            if key in self._memory_cache:
-                value, _ = self._memory_cache[key]
-                self._access_counter += 1
-                self._memory_cache[key] = (value, self._access_counter)
-                return value
-        return None
+        return self._memory_cache.get(self._make_key("memory", agent_name, topic, time_filter))
 
     def put_memory_view(
         self,
@@ -173,11 +242,7 @@ class AgentCache:
 
         key = self._make_key("memory", agent_name, topic, time_filter)
         with self._lock:
-            # Only evict if adding a NEW entry would exceed max_size
-            if key not in self._memory_cache and len(self._memory_cache) >= self.max_size:
-                self._evict_lru(self._memory_cache)
-            self._access_counter += 1
-            self._memory_cache[key] = (data, self._access_counter)
+            self._memory_cache.put(key, data)
 
     def invalidate_agent(self, agent_name: str) -> int:
         """
@@ -194,15 +259,7 @@ class AgentCache:
         """
         count = 0
         with self._lock:
-            # Remove all entries containing this agent name
-            keys_to_remove = []
-
-            # Check context cache
-            for key in self._context_cache:
-                # The key contains agent_name, so we can't directly check
-                # but we track keys to remove
-                keys_to_remove.append(key)
-
+            # Keys are digests, so entries cannot be matched to agent_name.
             # For simplicity, we'll clear all caches when invalidating
             # In production, you'd want to store agent_name separately
             count = len(self._context_cache) + len(self._memory_cache)
@@ -221,7 +278,6 @@ class AgentCache:
         with self._lock:
             self._context_cache.clear()
             self._memory_cache.clear()
-            self._access_counter = 0
 
     def get_stats(self) -> Dict[str, int]:
         """
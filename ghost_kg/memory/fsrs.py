@@ -77,6 +77,12 @@ class FSRS:
             0.0658,
             0.1542,
         ]
+        # Constants derived from the parameters, hoisted out of calculate_next
+        # because they do not depend on the card being reviewed.
+        # factor = 0.9^(-1/w_20) - 1 ensures R(S,S) = 90%
+        self._decay_factor = 0.9 ** (-1 / self.p[20]) - 1
+        self._d_0_4 = self._calculate_initial_difficulty(4)
+        self._exp_w8 = math.exp(self.p[8])
 
     def _calculate_initial_difficulty(self, rating: int) -> float:
         """
@@ -166,15 +172,13 @@ class FSRS:
                 elapsed_days = 0
             
             # R(t,S) = (1 + factor * t/S)^(-w_20)
-            # where factor = 0.9^(-1/w_20) - 1 to ensure R(S,S) = 90%
-            factor = 0.9 ** (-1 / self.p[20]) - 1
-            retrievability = (1 + factor * elapsed_days / s) ** -self.p[20]
+            retrievability = (1 + self._decay_factor * elapsed_days / s) ** -self.p[20]
         else:
             # Match legacy implementation: new cards have 1.0 retrievability
             retrievability = 1.0
 
-        # Calculate D_0(4) for mean reversion (FSRS-6)
-        d_0_4 = self._calculate_initial_difficulty(4)
+        # D_0(4) for mean reversion (FSRS-6)
+        d_0_4 = self._d_0_4
 
         # Update difficulty with linear damping (FSRS-5+)
         # ΔD(G) = -w_6 * (G - 3)
@@ -208,7 +212,7 @@ class FSRS:
                 easy_bonus = self.p[16] if rating == Rating.Easy else 1
                 next_s = s * (
                     1
-                    + math.exp(self.p[8])
+                    + self._exp_w8
                     * (11 - next_d)
                     * (s ** -self.p[9])
                     * (math.exp((1 - retrievability) * self.p[10]) - 1)
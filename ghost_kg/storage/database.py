@@ -6,13 +6,17 @@ Supports SQLite (default), PostgreSQL, and MySQL.
 
 import datetime
 import json
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union, Tuple
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, insert, and_, or_, func, text
 from sqlalchemy.dialects import postgresql, mysql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from .engine import DatabaseManager
@@ -20,6 +24,53 @@ from .models import Node, Edge, Log
 from ..utils.exceptions import DatabaseError, ValidationError
 from ..utils.time_utils import SimulationTime
 
+# Upper bound for the number of bound parameters in a single IN (...) clause.
+# Older SQLite builds cap host parameters at 999 per statement.
+_IN_CLAUSE_CHUNK = 500
+
+
+@lru_cache(maxsize=256)
+def _compile_sql(sql: str, n_params: int) -> TextClause:
+    """
+    Build the text() clause for a raw SQL string once.
+
+    Positional ``?`` placeholders are rewritten to named ``:p0``, ``:p1``, ...
+    parameters. The result is immutable, so repeated raw queries through
+    ``KnowledgeDB.conn`` reuse the same clause object.
+    """
+    for i in range(n_params):
+        sql = sql.replace('?', f':p{i}', 1)
+    return text(sql)
+
+
+class _RowWrapper(dict):
+    """Result row supporting both dict-style and index access."""
+
+    def __init__(self, row):
+        # Store the row mapping as dict items
+        super().__init__(row._mapping)
+        # Also store values for index access
+        self._values = tuple(row)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._values[key]
+        return super().__getitem__(key)
+
+
+def _split_timestamp(
+    timestamp: Optional[Union[datetime.datetime, SimulationTime]],
+) -> Tuple[Optional[datetime.datetime], Optional[int], Optional[int]]:
+    """Resolve a timestamp argument into (datetime, sim_day, sim_hour)."""
+    if timestamp is None:
+        return datetime.datetime.now(datetime.timezone.utc), None, None
+    if isinstance(timestamp, SimulationTime):
+        round_time = timestamp.to_round()
+        if round_time:
+            return timestamp.to_datetime(), round_time[0], round_time[1]
+        return timestamp.to_datetime(), None, None
+    return timestamp, None, None
+
 
 @dataclass
 class NodeState:
@@ -102,6 +153,11 @@ class KnowledgeDB:
             
             # Get a session for operations
             self._session: Optional[Session] = None
+            # Per-thread session of the enclosing transaction() block, if any
+            self._tx = threading.local()
+            # Bumped whenever any thread's transaction() block ends
+            self._commit_epoch = 0
+            self._epoch_lock = threading.Lock()
             
         except Exception as e:
             raise DatabaseError(f"Failed to initialize database: {e}") from e
@@ -109,6 +165,9 @@ class KnowledgeDB:
     @property
     def session(self) -> Session:
         """Get or create a database session."""
+        tx_session = self._transaction_session()
+        if tx_session is not None:
+            return tx_session
         if self._session is None or not self._session.is_active:
             self._session = self.db_manager.get_session()
         return self._session
@@ -160,51 +219,34 @@ class KnowledgeDB:
             
             def execute(self, sql, params=None):
                 """Execute raw SQL using SQLAlchemy."""
-                from sqlalchemy import text
-                
                 # Get a fresh session to ensure it's not closed
                 session = self.db.session
                 
                 # Convert positional parameters to dictionary for SQLAlchemy
                 if params:
                     if isinstance(params, (list, tuple)):
-                        # Convert SQL with ? placeholders to :p0, :p1, etc.
-                        sql_converted = sql
-                        param_dict = {}
-                        for i, param in enumerate(params):
-                            sql_converted = sql_converted.replace('?', f':p{i}', 1)
-                            param_dict[f'p{i}'] = param
-                        result = session.execute(text(sql_converted), param_dict)
+                        # SQL with ? placeholders is rewritten to :p0, :p1, etc.
+                        param_dict = {f'p{i}': param for i, param in enumerate(params)}
+                        result = session.execute(_compile_sql(sql, len(params)), param_dict)
                     else:
-                        result = session.execute(text(sql), params)
+                        result = session.execute(_compile_sql(sql, 0), params)
                 else:
-                    result = session.execute(text(sql))
+                    result = session.execute(_compile_sql(sql, 0))
                 
                 # Fetch all results before committing to avoid closed cursor issues
                 # Store the fetched data for later retrieval
-                # Convert Row objects to a custom wrapper that supports both dict and tuple access
+                # Convert Row objects to a wrapper that supports both dict and tuple access
                 if result.returns_rows:
                     rows = result.fetchall()
-                    # Create custom row wrapper that supports both dict-style and index access
-                    class RowWrapper(dict):
-                        def __init__(self, row):
-                            # Store the row mapping as dict items
-                            super().__init__(row._mapping)
-                            # Also store values for index access
-                            self._values = tuple(row)
-                        
-                        def __getitem__(self, key):
-                            if isinstance(key, int):
-                                return self._values[key]
-                            return super().__getitem__(key)
-                    
-                    self._cached_results = [RowWrapper(row) for row in rows]
+                    self._cached_results = [_RowWrapper(row) for row in rows]
                 else:
                     self._cached_results = []
                 self._fetch_index = 0
                 self._result = result
                 
-                session.commit()  # Auto-commit for compatibility
+                # Auto-commit for compatibility, unless inside transaction()
+                if self.db._transaction_session() is None:
+                    session.commit()
                 return self
             
             def fetchall(self):
@@ -231,28 +273,106 @@ class KnowledgeDB:
         """Create a new session for isolated operations."""
         return self.db_manager.get_session()
     
-    def _execute_with_session(self, operation, *args, **kwargs):
-        """Execute an operation with proper session management."""
-        session = None
+    def _transaction_session(self) -> Optional[Session]:
+        """Return this thread's transaction() session, or None outside one."""
+        return getattr(self._tx, "session", None)
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the current thread is inside a transaction() block."""
+        return self._transaction_session() is not None
+    
+    @property
+    def commit_epoch(self) -> int:
+        """
+        Counter bumped each time a transaction() block commits or rolls back.
+        
+        Other threads cannot see an open transaction, so anything derived from
+        the database should be cached under the epoch read before computing it.
+        """
+        return self._commit_epoch
+    
+    @contextmanager
+    def _session_scope(self, commit: bool = True) -> Iterator[Session]:
+        """
+        Provide the session for a single operation.
+        
+        Inside transaction() the shared session is reused and writes are only
+        flushed; otherwise a fresh session is opened, committed (when
+        ``commit`` is True), rolled back on error and closed.
+        """
+        tx_session = self._transaction_session()
+        if tx_session is not None:
+            yield tx_session
+            if commit:
+                tx_session.flush()
+            return
+        
+        session = self._get_new_session()
         try:
-            session = self._get_new_session()
-            result = operation(session, *args, **kwargs)
-            session.commit()
-            return result
-        except Exception as e:
-            if session:
-                session.rollback()
+            yield session
+            if commit:
+                session.commit()
+        except Exception:
+            session.rollback()
             raise
         finally:
-            if session:
-                session.close()
+            session.close()
+    
+    @contextmanager
+    def transaction(self) -> Iterator["KnowledgeDB"]:
+        """
+        Group several operations into one database transaction.
+        
+        Every KnowledgeDB call made by the current thread inside the block,
+        including raw SQL through ``conn``, runs in one shared session and is
+        committed once on exit, or rolled back entirely if the block raises.
+        Nested blocks join the outermost transaction.
+        
+        Yields:
+            KnowledgeDB: This database
+        
+        Raises:
+            DatabaseError: If the final commit fails
+        
+        Example:
+            >>> with db.transaction():
+            ...     for i in range(100):
+            ...         db.upsert_node("Alice", f"node_{i}")
+        """
+        if self._transaction_session() is not None:
+            yield self
+            return
+        
+        session = self._get_new_session()
+        self._tx.session = session
+        try:
+            yield self
+            try:
+                session.commit()
+            except SQLAlchemyError as e:
+                raise DatabaseError(f"Failed to commit transaction: {e}") from e
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            self._tx.session = None
+            session.close()
+            with self._epoch_lock:
+                self._commit_epoch += 1
+    
+    def _execute_with_session(self, operation, *args, **kwargs):
+        """Execute an operation with proper session management."""
+        with self._session_scope() as session:
+            return operation(session, *args, **kwargs)
     
     def close(self):
-        """Close the database session."""
+        """Close the database session and release pooled connections."""
         try:
             if self._session:
                 self._session.close()
                 self._session = None
+            self.db_manager.dispose()
         except Exception:
             # Ignore errors during cleanup
             pass
@@ -284,67 +404,119 @@ class KnowledgeDB:
         if not owner_id or not node_id:
             raise ValidationError("owner_id and node_id are required")
 
-        # Handle timestamp
-        if timestamp is None:
-            ts = datetime.datetime.now(datetime.timezone.utc)
-            sim_day = None
-            sim_hour = None
-        elif isinstance(timestamp, SimulationTime):
-            ts = timestamp.to_datetime()
-            round_time = timestamp.to_round()
-            sim_day = round_time[0] if round_time else None
-            sim_hour = round_time[1] if round_time else None
-        else:
-            # datetime.datetime
-            ts = timestamp
-            sim_day = None
-            sim_hour = None
+        ts, sim_day, sim_hour = _split_timestamp(timestamp)
 
         try:
-            def _upsert(session):
-                # Check if node exists
-                existing_node = session.query(Node).filter_by(
-                    owner_id=owner_id,
-                    id=node_id
-                ).first()
-                
-                if existing_node:
-                    # Update existing node
-                    if fsrs_state:
-                        existing_node.stability = fsrs_state.stability
-                        existing_node.difficulty = fsrs_state.difficulty
-                        existing_node.last_review = fsrs_state.last_review
-                        existing_node.reps = fsrs_state.reps
-                        existing_node.state = fsrs_state.state
-                        existing_node.sim_day = sim_day
-                        existing_node.sim_hour = sim_hour
-                else:
-                    # Create new node
-                    node_data = {
-                        "owner_id": owner_id,
-                        "id": node_id,
-                        "created_at": ts,
-                        "sim_day": sim_day,
-                        "sim_hour": sim_hour,
-                    }
-                    
-                    if fsrs_state:
-                        node_data.update({
-                            "stability": fsrs_state.stability,
-                            "difficulty": fsrs_state.difficulty,
-                            "last_review": fsrs_state.last_review,
-                            "reps": fsrs_state.reps,
-                            "state": fsrs_state.state,
-                        })
-                    
-                    new_node = Node(**node_data)
-                    session.add(new_node)
-            
-            self._execute_with_session(_upsert)
-            
+            self._execute_with_session(
+                self._upsert_nodes_in_session,
+                owner_id,
+                {node_id: fsrs_state},
+                ts,
+                sim_day,
+                sim_hour,
+            )
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to upsert node {node_id} for {owner_id}: {e}") from e
 
+    def _upsert_nodes_in_session(
+        self,
+        session: Session,
+        owner_id: str,
+        nodes: Mapping[str, Optional[NodeState]],
+        ts: Optional[datetime.datetime],
+        sim_day: Optional[int],
+        sim_hour: Optional[int],
+    ) -> None:
+        """Upsert already-validated nodes for one owner within ``session``."""
+        node_ids = list(nodes)
+        existing = {}
+        for start in range(0, len(node_ids), _IN_CLAUSE_CHUNK):
+            chunk = node_ids[start:start + _IN_CLAUSE_CHUNK]
+            for node in session.query(Node).filter(
+                Node.owner_id == owner_id, Node.id.in_(chunk)
+            ):
+                existing[node.id] = node
+
+        new_rows = []
+        for node_id, fsrs_state in nodes.items():
+            node = existing.get(node_id)
+            if node is not None:
+                if fsrs_state:
+                    node.stability = fsrs_state.stability
+                    node.difficulty = fsrs_state.difficulty
+                    node.last_review = fsrs_state.last_review
+                    node.reps = fsrs_state.reps
+                    node.state = fsrs_state.state
+                    node.sim_day = sim_day
+                    node.sim_hour = sim_hour
+                continue
+
+            row = {
+                "owner_id": owner_id,
+                "id": node_id,
+                "created_at": ts,
+                "sim_day": sim_day,
+                "sim_hour": sim_hour,
+            }
+            if fsrs_state:
+                row.update({
+                    "stability": fsrs_state.stability,
+                    "difficulty": fsrs_state.difficulty,
+                    "last_review": fsrs_state.last_review,
+                    "reps": fsrs_state.reps,
+                    "state": fsrs_state.state,
+                })
+            new_rows.append(row)
+
+        if new_rows:
+            session.execute(insert(Node), new_rows)
+
+    def upsert_nodes_bulk(
+        self,
+        owner_id: str,
+        nodes: Union[Iterable[str], Mapping[str, Optional[NodeState]]],
+        timestamp: Optional[Union[datetime.datetime, SimulationTime]] = None,
+    ) -> None:
+        """
+        Upsert many nodes for one owner in a single transaction.
+
+        Equivalent to calling :meth:`upsert_node` for every node, but existing
+        nodes are fetched with one query and new nodes are written with a
+        single executemany INSERT instead of one commit per node.
+
+        Args:
+            owner_id (str): Owner/agent identifier
+            nodes (Union[Iterable[str], Mapping[str, Optional[NodeState]]]):
+                Node identifiers, or a mapping of node identifier to the FSRS
+                state to store for it (None leaves an existing node untouched)
+            timestamp (Optional[Union[datetime.datetime, SimulationTime]]):
+                Optional timestamp (defaults to now). Can be a datetime or SimulationTime object.
+
+        Returns:
+            None
+
+        Raises:
+            ValidationError: If parameters are invalid
+            DatabaseError: If database operation fails
+        """
+        if not isinstance(nodes, Mapping):
+            nodes = dict.fromkeys(nodes)
+        if not owner_id or not all(nodes):
+            raise ValidationError("owner_id and node_id are required")
+        if not nodes:
+            return
+
+        ts, sim_day, sim_hour = _split_timestamp(timestamp)
+
+        try:
+            self._execute_with_session(
+                self._upsert_nodes_in_session, owner_id, nodes, ts, sim_day, sim_hour
+            )
+        except SQLAlchemyError as e:
+            raise DatabaseError(
+                f"Failed to bulk upsert {len(nodes)} nodes for {owner_id}: {e}"
+            ) from e
+
     def add_relation(
         self,
         owner_id: str,
@@ -383,70 +555,149 @@ class KnowledgeDB:
         if not -1.0 <= sentiment <= 1.0:
             raise ValidationError(f"sentiment must be between -1.0 and 1.0, got {sentiment}")
 
-        # Handle timestamp
-        if timestamp is None:
-            ts = datetime.datetime.now(datetime.timezone.utc)
-            sim_day = None
-            sim_hour = None
-        elif isinstance(timestamp, SimulationTime):
-            ts = timestamp.to_datetime()
-            round_time = timestamp.to_round()
-            sim_day = round_time[0] if round_time else None
-            sim_hour = round_time[1] if round_time else None
-        else:
-            # datetime.datetime
-            ts = timestamp
-            sim_day = None
-            sim_hour = None
+        ts, sim_day, sim_hour = _split_timestamp(timestamp)
 
         try:
-            session = self._get_new_session()
-            
-            # Ensure source and target nodes exist
-            self.upsert_node(owner_id, source, timestamp=timestamp)
-            self.upsert_node(owner_id, target, timestamp=timestamp)
-            
-            # Check if edge exists
-            existing_edge = session.query(Edge).filter_by(
-                owner_id=owner_id,
-                source=source,
-                target=target,
-                relation=relation
-            ).first()
-            
-            if existing_edge:
-                # Update existing edge
-                existing_edge.sentiment = sentiment
-                existing_edge.created_at = ts
-                existing_edge.sim_day = sim_day
-                existing_edge.sim_hour = sim_hour
-            else:
-                # Create new edge
-                new_edge = Edge(
+            with self._session_scope() as session:
+                # Ensure source and target nodes exist; the arguments were
+                # validated above, so skip upsert_node's checks and sessions
+                self._upsert_nodes_in_session(
+                    session, owner_id, dict.fromkeys((source, target)), ts, sim_day, sim_hour
+                )
+                session.flush()
+
+                # Check if edge exists
+                existing_edge = session.query(Edge).filter_by(
                     owner_id=owner_id,
                     source=source,
                     target=target,
-                    relation=relation,
-                    sentiment=sentiment,
-                    created_at=ts,
-                    sim_day=sim_day,
-                    sim_hour=sim_hour
-                )
-                session.add(new_edge)
-            
-            session.commit()
-            session.close()
+                    relation=relation
+                ).first()
+                
+                if existing_edge:
+                    # Update existing edge
+                    existing_edge.sentiment = sentiment
+                    existing_edge.created_at = ts
+                    existing_edge.sim_day = sim_day
+                    existing_edge.sim_hour = sim_hour
+                else:
+                    # Create new edge
+                    new_edge = Edge(
+                        owner_id=owner_id,
+                        source=source,
+                        target=target,
+                        relation=relation,
+                        sentiment=sentiment,
+                        created_at=ts,
+                        sim_day=sim_day,
+                        sim_hour=sim_hour
+                    )
+                    session.add(new_edge)
             
         except ValidationError:
             raise  # Re-raise validation errors
         except SQLAlchemyError as e:
-            if session:
-                session.rollback()
-                session.close()
             raise DatabaseError(
                 f"Failed to add relation {source} -{relation}-> {target} for {owner_id}: {e}"
             ) from e
 
+    def add_relations_bulk(
+        self,
+        owner_id: str,
+        relations: Iterable[Tuple[Any, ...]],
+        timestamp: Optional[Union[datetime.datetime, SimulationTime]] = None,
+    ) -> None:
+        """
+        Add many relations for one owner in a single transaction.
+
+        Equivalent to calling :meth:`add_relation` for every relation: missing
+        source and target nodes are created, and relations that already exist
+        get their sentiment and timestamp refreshed. All rows are written in
+        one session with executemany INSERTs instead of one commit per edge.
+
+        Args:
+            owner_id (str): Owner/agent identifier
+            relations (Iterable[Tuple[Any, ...]]): ``(source, relation, target)``
+                or ``(source, relation, target, sentiment)`` tuples. When the
+                same relation appears more than once, the last one wins.
+            timestamp (Optional[Union[datetime.datetime, SimulationTime]]):
+                Optional timestamp (defaults to now). Can be a datetime or SimulationTime object.
+
+        Returns:
+            None
+
+        Raises:
+            ValidationError: If parameters are invalid
+            DatabaseError: If database operation fails
+        """
+        if not owner_id:
+            raise ValidationError("owner_id, source, relation, and target are required")
+
+        edges: Dict[Tuple[str, str, str], float] = {}
+        for item in relations:
+            if not isinstance(item, (tuple, list)) or len(item) not in (3, 4):
+                raise ValidationError(
+                    "Each relation must be a (source, relation, target[, sentiment]) tuple"
+                )
+            source, relation, target = item[:3]
+            if not source or not relation or not target:
+                raise ValidationError("owner_id, source, relation, and target are required")
+            sentiment = item[3] if len(item) == 4 and item[3] is not None else 0.0
+            if not -1.0 <= sentiment <= 1.0:
+                raise ValidationError(f"sentiment must be between -1.0 and 1.0, got {sentiment}")
+            edges[(source, relation, target)] = sentiment
+        if not edges:
+            return
+
+        ts, sim_day, sim_hour = _split_timestamp(timestamp)
+
+        def _add_many(session):
+            node_ids = dict.fromkeys(
+                node_id for source, _, target in edges for node_id in (source, target)
+            )
+            self._upsert_nodes_in_session(session, owner_id, node_ids, ts, sim_day, sim_hour)
+            # Make the new nodes visible to the foreign keys of the edge INSERT
+            session.flush()
+
+            sources = list(dict.fromkeys(source for source, _, _ in edges))
+            existing = {}
+            for start in range(0, len(sources), _IN_CLAUSE_CHUNK):
+                chunk = sources[start:start + _IN_CLAUSE_CHUNK]
+                for edge in session.query(Edge).filter(
+                    Edge.owner_id == owner_id, Edge.source.in_(chunk)
+                ):
+                    existing[(edge.source, edge.relation, edge.target)] = edge
+
+            new_rows = []
+            for (source, relation, target), sentiment in edges.items():
+                edge = existing.get((source, relation, target))
+                if edge is not None:
+                    edge.sentiment = sentiment
+                    edge.created_at = ts
+                    edge.sim_day = sim_day
+                    edge.sim_hour = sim_hour
+                else:
+                    new_rows.append({
+                        "owner_id": owner_id,
+                        "source": source,
+                        "target": target,
+                        "relation": relation,
+                        "sentiment": sentiment,
+                        "created_at": ts,
+                        "sim_day": sim_day,
+                        "sim_hour": sim_hour,
+                    })
+
+            if new_rows:
+                session.execute(insert(Edge), new_rows)
+
+        try:
+            self._execute_with_session(_add_many)
+        except SQLAlchemyError as e:
+            raise DatabaseError(
+                f"Failed to bulk add {len(edges)} relations for {owner_id}: {e}"
+            ) from e
+
     def log_interaction(
         self,
         agent: str,
@@ -523,31 +774,41 @@ class KnowledgeDB:
             uuid_to_use = content_uuid if content_uuid is not None else str(uuid.uuid4())
 
         try:
-            session = self._get_new_session()
-            
             new_log = Log(
                 agent_name=agent,
                 action_type=action,
                 content=stored_content,
                 content_uuid=uuid_to_use,
-                annotations=json.dumps(annotations),
+                annotations=json.dumps(annotations, separators=(",", ":")),
                 timestamp=ts,
                 sim_day=sim_day,
                 sim_hour=sim_hour
             )
             
-            session.add(new_log)
-            session.commit()
-            session.close()
+            with self._session_scope() as session:
+                session.add(new_log)
             
             return uuid_to_use
             
         except (SQLAlchemyError, TypeError) as e:
-            if session:
-                session.rollback()
-                session.close()
             raise DatabaseError(f"Failed to log interaction for {agent}: {e}") from e
 
+    @staticmethod
+    def _node_dict(node: Node) -> Dict[str, Any]:
+        """Convert a Node row to the dictionary format returned by the getters."""
+        return {
+            "owner_id": node.owner_id,
+            "id": node.id,
+            "stability": node.stability,
+            "difficulty": node.difficulty,
+            "last_review": node.last_review,
+            "reps": node.reps,
+            "state": node.state,
+            "created_at": node.created_at,
+            "sim_day": node.sim_day,
+            "sim_hour": node.sim_hour,
+        }
+
     def get_node(self, owner_id: str, node_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a node by ID.
@@ -563,36 +824,76 @@ class KnowledgeDB:
             DatabaseError: If query fails
         """
         try:
-            session = self._get_new_session()
-            
-            node = session.query(Node).filter_by(
-                owner_id=owner_id,
-                id=node_id
-            ).first()
-            
-            session.close()
-            
-            if node:
-                # Convert to dictionary for backward compatibility
-                return {
-                    "owner_id": node.owner_id,
-                    "id": node.id,
-                    "stability": node.stability,
-                    "difficulty": node.difficulty,
-                    "last_review": node.last_review,
-                    "reps": node.reps,
-                    "state": node.state,
-                    "created_at": node.created_at,
-                    "sim_day": node.sim_day,
-                    "sim_hour": node.sim_hour,
-                }
-            return None
+            with self._session_scope(commit=False) as session:
+                node = session.query(Node).filter_by(
+                    owner_id=owner_id,
+                    id=node_id
+                ).first()
+                
+                if node:
+                    # Convert to dictionary for backward compatibility
+                    return self._node_dict(node)
+                return None
             
         except SQLAlchemyError as e:
-            if session:
-                session.close()
             raise DatabaseError(f"Failed to get node {node_id} for {owner_id}: {e}") from e
 
+    def get_nodes(self, owner_id: str, node_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many nodes of one owner by ID.
+
+        Args:
+            owner_id (str): Owner/agent identifier
+            node_ids (Iterable[str]): Node identifiers
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Node data keyed by node ID, in the same
+                format as :meth:`get_node`. Missing nodes are omitted.
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        try:
+            found: Dict[str, Dict[str, Any]] = {}
+            with self._session_scope(commit=False) as session:
+                for start in range(0, len(node_ids), _IN_CLAUSE_CHUNK):
+                    chunk = node_ids[start:start + _IN_CLAUSE_CHUNK]
+                    for node in session.query(Node).filter(
+                        Node.owner_id == owner_id, Node.id.in_(chunk)
+                    ):
+                        found[node.id] = self._node_dict(node)
+            return found
+
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get nodes for {owner_id}: {e}") from e
+
+    def list_nodes_by_owner(self, owner_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every node of one owner.
+
+        The lookup is an index range scan on ``owner_id``, so its cost grows
+        with the owner's node count, not the size of the whole table.
+
+        Args:
+            owner_id (str): Owner/agent identifier
+
+        Returns:
+            List[Dict[str, Any]]: Node data in the same format as :meth:`get_node`
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        try:
+            with self._session_scope(commit=False) as session:
+                return [
+                    self._node_dict(node)
+                    for node in session.query(Node).filter(Node.owner_id == owner_id)
+                ]
+
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to list nodes for {owner_id}: {e}") from e
+
     def get_agent_stance(
         self, owner_id: str, topic: str, current_time: Optional[Union[datetime.datetime, SimulationTime]] = None
     ) -> List[Dict[str, Any]]:
@@ -624,25 +925,22 @@ class KnowledgeDB:
         search_term = f"%{topic}%"
 
         try:
-            session = self._get_new_session()
-            
             # SQL logic:
             # 1. Source must be 'I' (or agent name)
             # 2. Target matches topic OR it was created in the last 60 mins OF SIMULATION TIME
             time_threshold = ts - datetime.timedelta(minutes=60)
             
-            edges = session.query(Edge).filter(
-                and_(
-                    Edge.owner_id == owner_id,
-                    or_(Edge.source == 'I', Edge.source == owner_id),
-                    or_(
-                        Edge.target.like(search_term),
-                        Edge.created_at >= time_threshold
+            with self._session_scope(commit=False) as session:
+                edges = session.query(Edge).filter(
+                    and_(
+                        Edge.owner_id == owner_id,
+                        or_(Edge.source == 'I', Edge.source == owner_id),
+                        or_(
+                            Edge.target.like(search_term),
+                            Edge.created_at >= time_threshold
+                        )
                     )
-                )
-            ).order_by(Edge.created_at.desc()).limit(8).all()
-            
-            session.close()
+                ).order_by(Edge.created_at.desc()).limit(8).all()
             
             # Convert to dictionaries
             return [
@@ -656,8 +954,6 @@ class KnowledgeDB:
             ]
             
         except SQLAlchemyError as e:
-            if session:
-                session.close()
             raise DatabaseError(f"Failed to get agent stance for {owner_id} on {topic}: {e}") from e
 
     def get_world_knowledge(self, owner_id: str, topic: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -678,21 +974,18 @@ class KnowledgeDB:
         search_term = f"%{topic}%"
 
         try:
-            session = self._get_new_session()
-            
             # Get edges where source is not 'I' and either source or target matches topic
-            edges = session.query(Edge).filter(
-                and_(
-                    Edge.owner_id == owner_id,
-                    Edge.source != 'I',
-                    or_(
-                        Edge.source.like(search_term),
-                        Edge.target.like(search_term)
+            with self._session_scope(commit=False) as session:
+                edges = session.query(Edge).filter(
+                    and_(
+                        Edge.owner_id == owner_id,
+                        Edge.source != 'I',
+                        or_(
+                            Edge.source.like(search_term),
+                            Edge.target.like(search_term)
+                        )
                     )
-                )
-            ).limit(limit).all()
-            
-            session.close()
+                ).limit(limit).all()
             
             # Convert to dictionaries
             return [
@@ -706,8 +999,6 @@ class KnowledgeDB:
             ]
             
         except SQLAlchemyError as e:
-            if session:
-                session.close()
             raise DatabaseError(f"Failed to get world knowledge for {owner_id} on {topic}: {e}") from e
 
     def __del__(self):
@@ -9,11 +9,22 @@ from typing import Optional
 from urllib.parse import urlparse
 from sqlalchemy import create_engine, Engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import QueuePool
 
 from .models import Base
 from ..utils.exceptions import DatabaseError
 
+# Page size for newly created SQLite files (bytes)
+SQLITE_PAGE_SIZE = 8192
+# Upper bound on the memory-mapped region of a SQLite file (256 MiB)
+SQLITE_MMAP_SIZE = 268435456
+# Page cache per connection; negative values are KiB (64 MiB)
+SQLITE_CACHE_SIZE = -65536
+# How long a connection waits on a locked database before failing (ms)
+SQLITE_BUSY_TIMEOUT_MS = 5000
+# Prepared statements kept per sqlite3 connection (driver default: 128)
+SQLITE_CACHED_STATEMENTS = 512
+
 
 class DatabaseManager:
     """
@@ -111,7 +122,12 @@ class DatabaseManager:
             
             if dialect == "sqlite":
                 # SQLite-specific configuration
-                engine_kwargs["connect_args"] = {"check_same_thread": False}
+                # The ORM emits a stable set of statement strings, so a larger
+                # prepared-statement cache keeps all of them parsed
+                engine_kwargs["connect_args"] = {
+                    "check_same_thread": False,
+                    "cached_statements": SQLITE_CACHED_STATEMENTS,
+                }
                 
                 # For in-memory databases, we MUST use StaticPool to maintain the same connection
                 # Otherwise each query gets a new connection = new empty database
@@ -119,15 +135,10 @@ class DatabaseManager:
                     from sqlalchemy.pool import StaticPool
                     engine_kwargs["poolclass"] = StaticPool
                 else:
-                    engine_kwargs["poolclass"] = NullPool  # File-based SQLite doesn't need pooling
-                
-                # Enable foreign keys for SQLite
-                @event.listens_for(Engine, "connect")
-                def set_sqlite_pragma(dbapi_conn, connection_record):
-                    if dialect == "sqlite":
-                        cursor = dbapi_conn.cursor()
-                        cursor.execute("PRAGMA foreign_keys=ON")
-                        cursor.close()
+                    # Keep connections open between sessions: reconnecting per
+                    # operation re-reads the schema and, in WAL mode, checkpoints
+                    # and deletes the -wal file every time the last handle closes.
+                    engine_kwargs["poolclass"] = QueuePool
             
             elif dialect == "postgresql":
                 # PostgreSQL-specific configuration
@@ -160,6 +171,11 @@ class DatabaseManager:
             # Create engine
             self.engine = create_engine(self.db_url, **engine_kwargs)
             
+            if dialect == "sqlite":
+                # Scope the pragma hook to this engine only; a listener on the
+                # Engine class would fire for every engine in the process.
+                event.listen(self.engine, "connect", self._set_sqlite_pragmas)
+            
             # Create session factory
             self.SessionLocal = sessionmaker(
                 bind=self.engine,
@@ -170,6 +186,33 @@ class DatabaseManager:
         except Exception as e:
             raise DatabaseError(f"Failed to initialize database engine: {e}") from e
     
+    def _set_sqlite_pragmas(self, dbapi_conn, connection_record):
+        """
+        Configure a new SQLite connection.
+        
+        Enables foreign keys, keeps temporary tables in memory, enlarges the
+        page cache to 64 MiB and waits up to 5 s on a locked database. File
+        databases additionally use write-ahead logging with synchronous=NORMAL,
+        so a commit appends to the WAL instead of forcing an fsync of the main
+        database file; WAL requires a local filesystem with shared-memory support.
+        Reads go through a memory map of up to SQLITE_MMAP_SIZE bytes.
+        
+        page_size only takes effect on a database that has no tables yet and
+        cannot be changed once the database is in WAL mode, so it is issued
+        first; on existing databases it is a harmless no-op.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        if ":memory:" not in self.db_url:
+            cursor.execute(f"PRAGMA page_size={SQLITE_PAGE_SIZE}")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.close()
+    
     def create_tables(self):
         """
         Create all tables defined in models if they don't exist.
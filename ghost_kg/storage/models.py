@@ -58,10 +58,12 @@ class Node(Base):
     sim_day: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     sim_hour: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
-    # Indexes
+    # Indexes; on SQLite the table is clustered on its primary key
+    # (WITHOUT ROWID), so (owner_id, id) lookups are a single B-tree probe
     __table_args__ = (
         Index("idx_kg_nodes_owner", "owner_id"),
         Index("idx_kg_nodes_last_review", "owner_id", "last_review"),
+        {"sqlite_with_rowid": False},
     )
     
     def __repr__(self):
@@ -121,6 +123,8 @@ class Edge(Base):
         Index("idx_kg_edges_owner_source", "owner_id", "source"),
         Index("idx_kg_edges_owner_target", "owner_id", "target"),
         Index("idx_kg_edges_created", "owner_id", "created_at"),
+        # Clustered on the primary key on SQLite, like kg_nodes
+        {"sqlite_with_rowid": False},
     )
     
     def __repr__(self):
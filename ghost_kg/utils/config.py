@@ -173,6 +173,19 @@ class FastModeConfig:
             raise ConfigurationError("Entity labels cannot be empty")
 
 
+# (section, key, type) of each setting GhostKGConfig.from_env reads
+_ENV_FIELDS = (
+    ("DATABASE", "PATH", str),
+    ("DATABASE", "CHECK_SAME_THREAD", bool),
+    ("DATABASE", "TIMEOUT", float),
+    ("LLM", "HOST", str),
+    ("LLM", "MODEL", str),
+    ("LLM", "TIMEOUT", int),
+    ("LLM", "MAX_RETRIES", int),
+    ("FAST_MODE", "GLINER_MODEL", str),
+)
+
+
 @dataclass
 class GhostKGConfig:
     """Main GhostKG configuration.
@@ -255,6 +268,10 @@ class GhostKGConfig:
             ... }
             >>> config = GhostKGConfig.from_dict(data)
         """
+        # No overrides: the defaults are valid as they are
+        if not data:
+            return cls()
+
         try:
             fsrs = FSRSConfig(**data.get("fsrs", {}))
             database = DatabaseConfig(**data.get("database", {}))
@@ -293,48 +310,25 @@ class GhostKGConfig:
         """
         prefix = prefix.upper()
 
-        def get_env(section: str, key: str, default: Any = None, type_func=str) -> Any:
-            """Get environment variable with type conversion."""
-            env_key = f"{prefix}_{section}_{key}".upper()
-            value = os.getenv(env_key)
+        # Collect only the variables that are actually set (FSRS params from
+        # env are not implemented)
+        overrides: Dict[str, Dict[str, Any]] = {}
+        for section, key, type_func in _ENV_FIELDS:
+            value = os.getenv(f"{prefix}_{section}_{key}".upper())
             if value is None:
-                return default
+                continue
 
             # Type conversion
             if type_func == bool:
-                return value.lower() in ("true", "1", "yes", "on")
-            elif type_func == int:
-                return int(value)
-            elif type_func == float:
-                return float(value)
-            else:
-                return value
-
-        # Build configuration from environment
-        fsrs = FSRSConfig()  # FSRS params from env not implemented
-
-        database = DatabaseConfig(
-            path=get_env("DATABASE", "PATH", DatabaseConfig.path),
-            check_same_thread=get_env(
-                "DATABASE", "CHECK_SAME_THREAD", DatabaseConfig.check_same_thread, bool
-            ),
-            timeout=get_env("DATABASE", "TIMEOUT", DatabaseConfig.timeout, float),
-        )
-
-        llm = LLMConfig(
-            host=get_env("LLM", "HOST", LLMConfig().host),
-            model=get_env("LLM", "MODEL", LLMConfig.model),
-            timeout=get_env("LLM", "TIMEOUT", LLMConfig.timeout, int),
-            max_retries=get_env("LLM", "MAX_RETRIES", LLMConfig.max_retries, int),
-        )
-
-        fast_mode = FastModeConfig(
-            gliner_model=get_env("FAST_MODE", "GLINER_MODEL", FastModeConfig.gliner_model),
-        )
-
-        config = cls(fsrs=fsrs, database=database, llm=llm, fast_mode=fast_mode)
-        config.validate()
-        return config
+                value = value.lower() in ("true", "1", "yes", "on")
+            elif type_func != str:
+                value = type_func(value)
+            overrides.setdefault(section.lower(), {})[key.lower()] = value
+
+        # Nothing to override: the defaults are valid as they are
+        if not overrides:
+            return cls()
+        return cls.from_dict(overrides)
 
     @classmethod
     def from_yaml(cls, path: str) -> "GhostKGConfig":
@@ -419,6 +413,65 @@ class GhostKGConfig:
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration from {path}: {e}") from e
 
+    @classmethod
+    def from_json_string(cls, text: str) -> "GhostKGConfig":
+        """
+        Load configuration from a JSON string.
+
+        Args:
+            text (str): JSON document with the same layout as a configuration file
+
+        Returns:
+            GhostKGConfig: GhostKGConfig instance
+
+        Raises:
+            ConfigurationError: If the JSON or the configuration is invalid
+
+        Examples:
+            >>> config = GhostKGConfig.from_json_string('{"llm": {"model": "llama2"}}')
+        """
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON in configuration: {e}") from e
+
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_yaml_string(cls, text: str) -> "GhostKGConfig":
+        """
+        Load configuration from a YAML string.
+
+        Requires PyYAML to be installed: `pip install pyyaml`
+
+        Args:
+            text (str): YAML document with the same layout as a configuration file
+
+        Returns:
+            GhostKGConfig: GhostKGConfig instance
+
+        Raises:
+            ConfigurationError: If the YAML or the configuration is invalid
+            ImportError: If PyYAML is not installed
+
+        Examples:
+            >>> config = GhostKGConfig.from_yaml_string("llm:\\n  model: llama2")
+        """
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(
+                "PyYAML is required to load YAML configuration. "
+                "Install it with: pip install pyyaml"
+            )
+
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Invalid YAML in configuration: {e}") from e
+
+        return cls.from_dict(data or {})
+
 
 # Convenience function for getting default config
 def get_default_config() -> GhostKGConfig:
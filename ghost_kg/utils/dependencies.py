@@ -4,12 +4,42 @@ This module provides utilities to check for optional dependencies and provide
 helpful error messages when they are missing.
 """
 
-import importlib.util
+import importlib
+from functools import lru_cache
 from typing import List, Tuple
 
 
+@lru_cache(maxsize=None)
+def _missing_modules(modules: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the names in ``modules`` that cannot be imported.
+
+    Importing gliner pulls in torch, so each probe is cached for the life of
+    the process; use DependencyChecker.reset_cache() to probe again.
+    """
+    missing = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            missing.append(name)
+    return tuple(missing)
+
+
 class DependencyChecker:
-    """Check for optional dependencies and provide helpful error messages."""
+    """Check for optional dependencies and provide helpful error messages.
+
+    Availability is probed by importing the packages once per process and
+    cached afterwards.
+    """
+
+    @staticmethod
+    def reset_cache() -> None:
+        """Forget cached availability results so the next check probes again.
+
+        Useful after installing a package at runtime or in tests that change
+        ``sys.modules``.
+        """
+        _missing_modules.cache_clear()
 
     @staticmethod
     def check_llm_available() -> Tuple[bool, List[str]]:
@@ -25,11 +55,7 @@ class DependencyChecker:
             >>> if not available:
             ...     print(f"Missing: {missing}")
         """
-        missing = []
-        try:
-            import ollama  # noqa: F401
-        except ImportError:
-            missing.append("ollama")
+        missing = list(_missing_modules(("ollama",)))
         return len(missing) == 0, missing
 
     @staticmethod
@@ -50,15 +76,7 @@ class DependencyChecker:
             ...     # Use fast mode
             ...     pass
         """
-        missing = []
-        try:
-            import gliner  # noqa: F401
-        except ImportError:
-            missing.append("gliner")
-        try:
-            import textblob  # noqa: F401
-        except ImportError:
-            missing.append("textblob")
+        missing = list(_missing_modules(("gliner", "textblob")))
         return len(missing) == 0, missing
 
     @staticmethod
@@ -131,42 +149,55 @@ class DependencyChecker:
         return extractors
 
     @staticmethod
-    def print_status() -> None:
-        """Print the status of all optional dependencies.
+    def format_status() -> str:
+        """Describe the status of all optional dependencies.
 
-        This is useful for debugging and understanding what features are available.
+        Returns:
+            str: Multi-line status report, as printed by print_status()
 
         Example:
-            >>> DependencyChecker.print_status()
+            >>> print(DependencyChecker.format_status())
             GhostKG Dependency Status:
-            ✓ LLM mode: Available
-            ✗ Fast mode: Missing dependencies: gliner, textblob
+              ✓ LLM mode: Available
+              ✗ Fast mode: Missing: gliner, textblob
         """
         llm_available, llm_missing = DependencyChecker.check_llm_available()
         fast_available, fast_missing = DependencyChecker.check_fast_available()
 
-        print("GhostKG Dependency Status:")
-
-        llm_missing = ", ".join(llm_missing)
-
-        print(
+        llm_missing_str = ", ".join(llm_missing)
+        fast_missing_str = ", ".join(fast_missing)
+        lines = [
+            "GhostKG Dependency Status:",
             f"  {'✓' if llm_available else '✗'} LLM mode: "
-            f"{'Available' if llm_available else f'Missing: {llm_missing}'}"
-        )
-        missing_str = ", ".join(fast_missing)
-
-        print(
+            f"{'Available' if llm_available else f'Missing: {llm_missing_str}'}",
             f"  {'✓' if fast_available else '✗'} Fast mode: "
-            f"{'Available' if fast_available else f'Missing: {missing_str}'}"
-        )
-
+            f"{'Available' if fast_available else f'Missing: {fast_missing_str}'}",
+        ]
 
         if not llm_available and not fast_available:
-            print("\n⚠ Warning: No extraction modes available!")
-            print("  Install at least one mode:")
-            print("    pip install ghost_kg[llm]   # For LLM-based extraction")
-            print("    pip install ghost_kg[fast]  # For fast local extraction")
-            print("    pip install ghost_kg[all]   # For both modes")
+            lines += [
+                "",
+                "⚠ Warning: No extraction modes available!",
+                "  Install at least one mode:",
+                "    pip install ghost_kg[llm]   # For LLM-based extraction",
+                "    pip install ghost_kg[fast]  # For fast local extraction",
+                "    pip install ghost_kg[all]   # For both modes",
+            ]
+        return "\n".join(lines)
+
+    @staticmethod
+    def print_status() -> None:
+        """Print the status of all optional dependencies.
+
+        This is useful for debugging and understanding what features are available.
+
+        Example:
+            >>> DependencyChecker.print_status()
+            GhostKG Dependency Status:
+              ✓ LLM mode: Available
+              ✗ Fast mode: Missing: gliner, textblob
+        """
+        print(DependencyChecker.format_status())
 
 
 # Convenience functions for backward compatibility
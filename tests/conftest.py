@@ -0,0 +1,30 @@
+"""Database fixtures shared by the unit and performance tests."""
+import pytest
+from ghost_kg import KnowledgeDB
+
+
+def _clear_tables(db):
+    """Delete every row, keeping the schema, so a database can be reused."""
+    for table in ("kg_edges", "kg_nodes", "kg_logs"):
+        db.conn.execute(f"DELETE FROM {table}")
+
+
+@pytest.fixture(scope="session")
+def clear_tables():
+    """The helper that empties a KnowledgeDB, for fixtures owning their own database."""
+    return _clear_tables
+
+
+@pytest.fixture(scope="class")
+def class_db():
+    """One in-memory KnowledgeDB shared by every test in a class."""
+    db = KnowledgeDB(":memory:")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def shared_db(class_db):
+    """The class-wide database, emptied after each test."""
+    yield class_db
+    _clear_tables(class_db)
@@ -10,6 +10,26 @@ from ghost_kg import GhostAgent, AgentManager, CognitiveLoop, Rating
 from ghost_kg.llm import get_llm_service
 
 
+@pytest.fixture(scope="session")
+def _shared_llm_service():
+    """Build the mock LLM service once per test session."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_llm_service(_shared_llm_service):
+    """Return the shared mock LLM service, reset to a clean state.
+
+    Recorded calls, return values and side effects are cleared before each
+    test so tests can configure the mock without leaking state.
+    """
+    _shared_llm_service.reset_mock(return_value=True, side_effect=True)
+    _shared_llm_service.chat.return_value = {
+        "message": {"content": "Mocked LLM response"}
+    }
+    return _shared_llm_service
+
+
 class TestMode1ExternalAPI:
     """Test Mode 1: External API mode (no internal LLM)."""
     
@@ -41,14 +61,12 @@ class TestMode1ExternalAPI:
 class TestMode2OllamaIntegration:
     """Test Mode 2: Integrated LLM with Ollama."""
     
-    def test_agent_with_ollama_service(self, tmp_path):
+    def test_agent_with_ollama_service(self, tmp_path, mock_llm_service):
         """Test agent with Ollama LLM service."""
-        from unittest.mock import patch
-        
         db_path = str(tmp_path / "test.db")
         
         # Mock Ollama service
-        mock_service = Mock()
+        mock_service = mock_llm_service
         mock_service.chat.return_value = {
             "message": {"content": "Test response"}
         }
@@ -68,12 +86,12 @@ class TestMode2OllamaIntegration:
 class TestMode3CommercialProviders:
     """Test Mode 3: Integrated LLM with commercial providers."""
     
-    def test_agent_with_openai_service(self, tmp_path):
+    def test_agent_with_openai_service(self, tmp_path, mock_llm_service):
         """Test agent with OpenAI-like LLM service."""
         db_path = str(tmp_path / "test.db")
         
         # Mock OpenAI service
-        mock_service = Mock()
+        mock_service = mock_llm_service
         mock_service.chat.return_value = {
             "message": {"content": "Response from GPT-4"}
         }
@@ -89,13 +107,13 @@ class TestMode3CommercialProviders:
         assert agent.llm_service is mock_service
         assert agent.llm_service.get_provider_type() == "openai"
     
-    def test_agent_manager_with_commercial_llm(self, tmp_path):
+    def test_agent_manager_with_commercial_llm(self, tmp_path, mock_llm_service):
         """Test AgentManager can create agents with commercial LLM."""
         db_path = str(tmp_path / "test.db")
         manager = AgentManager(db_path=db_path)
         
         # Mock commercial LLM service
-        mock_service = Mock()
+        mock_service = mock_llm_service
         mock_service.get_provider_type.return_value = "anthropic"
         
         # Create agent with LLM service
@@ -108,7 +126,7 @@ class TestMode3CommercialProviders:
 class TestMode4HybridMode:
     """Test Mode 4: Hybrid mode (external LLM + KG management)."""
     
-    def test_hybrid_agent_manager_with_external_llm(self, tmp_path):
+    def test_hybrid_agent_manager_with_external_llm(self, tmp_path, mock_llm_service):
         """Test using AgentManager with external LLM calls."""
         db_path = str(tmp_path / "test.db")
         manager = AgentManager(db_path=db_path)
@@ -127,7 +145,7 @@ class TestMode4HybridMode:
         context = manager.get_context("Alice", topic="AI safety")
         
         # Simulate external LLM call (mocked)
-        mock_llm = Mock()
+        mock_llm = mock_llm_service
         mock_llm.chat.return_value = {
             "message": {"content": "AI safety is crucial for development"}
         }
@@ -143,15 +161,12 @@ class TestMode4HybridMode:
 class TestCognitiveLoopWithLLMService:
     """Test CognitiveLoop works with LLMService."""
     
-    def test_cognitive_loop_with_llm_service(self, tmp_path):
+    def test_cognitive_loop_with_llm_service(self, tmp_path, mock_llm_service):
         """Test CognitiveLoop uses agent's LLM service."""
         db_path = str(tmp_path / "test.db")
         
-        # Mock LLM service
-        mock_service = Mock()
-        mock_service.chat.return_value = {
-            "message": {"content": "Mocked LLM response"}
-        }
+        # Mock LLM service (chat returns "Mocked LLM response" by default)
+        mock_service = mock_llm_service
         
         # Create agent with LLM service
         agent = GhostAgent("Alice", db_path=db_path, llm_service=mock_service)
@@ -1,6 +1,7 @@
 """Integration tests for multi-agent scenarios."""
 import pytest
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from ghost_kg import AgentManager, Rating
 
 
@@ -172,8 +173,7 @@ class TestMultiAgent:
         
         now = datetime.datetime.now(datetime.timezone.utc)
         
-        # Each agent learns different facts
-        for i in range(5):
+        def ingest_agent(i):
             manager.set_agent_time(f"Agent{i}", now)
             manager.absorb_content(
                 f"Agent{i}",
@@ -182,6 +182,11 @@ class TestMultiAgent:
                 triplets=[(f"Fact{i}", "is", "true")]
             )
         
+        # Each agent learns different facts; writes are isolated by owner_id,
+        # so the agents can ingest in parallel against the WAL-mode database
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(ingest_agent, range(5)))
+        
         # Verify each agent has only their own fact
         for i in range(5):
             context = manager.get_context(f"Agent{i}", f"Fact{i}")
@@ -10,50 +10,115 @@ These benchmarks measure the performance of core operations to:
 Run with: pytest tests/performance/test_benchmarks.py -v
 """
 
+import itertools
 import pytest
 import time
 import os
-import tempfile
-from ghost_kg import AgentManager, AgentCache, KnowledgeDB
+from ghost_kg import AgentManager
+
+# Manager benchmarks run against an in-memory database so they measure code
+# rather than disk latency; set GHOSTKG_TEST_DB to a file path to include I/O
+# (the file is deleted at the end of the session)
+TEST_DB = os.environ.get("GHOSTKG_TEST_DB", ":memory:")
+
+# Statements are defined once so repeated runs hit the compiled-statement caches
+COUNT_NODES = "SELECT COUNT(*) FROM kg_nodes WHERE owner_id = ?"
+COUNT_EDGES = "SELECT COUNT(*) FROM kg_edges WHERE owner_id = ?"
+QUERY_NODES_BY_OWNER = "SELECT * FROM kg_nodes WHERE owner_id = ?"
+QUERY_RECENT_EDGES = """
+    SELECT * FROM kg_edges
+    WHERE owner_id = ?
+    ORDER BY created_at DESC
+    LIMIT 20
+"""
+
+
+def assert_uses_index(conn, sql, params, index_name=None, index_only=False):
+    """Assert that SQLite answers a query with an index search, not a table scan.
+    
+    Args:
+        conn: KnowledgeDB connection shim to run EXPLAIN QUERY PLAN on
+        sql (str): Query to check
+        params (tuple): Query parameters
+        index_name (Optional[str]): Index the plan must use; any index
+            search is accepted when omitted
+        index_only (bool): Also require that no table rows are looked up,
+            i.e. the search runs on the clustered primary key of a WITHOUT
+            ROWID table or on a covering index
+    """
+    cursor = conn.cursor()
+    cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+    plan = " | ".join(row["detail"] for row in cursor.fetchall())
+    assert "SCAN" not in plan, f"Query falls back to a scan: {plan}"
+    assert "SEARCH" in plan, f"Query does not use an index: {plan}"
+    if index_name is not None:
+        assert f"INDEX {index_name}" in plan, f"Expected {index_name}: {plan}"
+    if index_only:
+        assert "USING PRIMARY KEY" in plan or "USING COVERING INDEX" in plan, \
+            f"Query looks up table rows: {plan}"
+
+
+def seed_edges(db, owner_id, count=50):
+    """Seed ``count`` "related" edges over a ring of 10 nodes in one transaction.
+    
+    Args:
+        db (KnowledgeDB): Database to seed
+        owner_id (str): Owner of the edges
+        count (int): Number of relations to write (repeats collapse into the
+            10 distinct ring edges)
+    """
+    db.add_relations_bulk(
+        owner_id,
+        ((f"node_{i % 10}", "related", f"node_{(i + 1) % 10}", 0.0) for i in range(count)),
+    )
+
+
+@pytest.fixture(scope="session")
+def session_manager():
+    """One AgentManager on TEST_DB shared by every manager benchmark."""
+    manager = AgentManager(db_path=TEST_DB)
+    yield manager
+    manager.db.close()
+    if TEST_DB == ":memory:":
+        return
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(TEST_DB + suffix):
+            os.unlink(TEST_DB + suffix)
+
+
+@pytest.fixture
+def fresh_manager(session_manager, clear_tables):
+    """The shared manager, emptied of agents, rows and cached contexts after each test."""
+    yield session_manager
+    clear_tables(session_manager.db)
+    session_manager.agents.clear()
+    session_manager.context_cache.clear()
 
 
 class TestDatabasePerformance:
     """Benchmark database operations."""
     
-    def setup_method(self):
-        """Set up test database."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        self.db = KnowledgeDB(self.db_path)
-    
-    def teardown_method(self):
-        """Clean up test database."""
-        if hasattr(self, 'db'):
-            self.db.conn.close()
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+    @pytest.fixture(autouse=True)
+    def _use_db(self, shared_db):
+        """Expose the shared database."""
+        self.db = shared_db
     
     def test_benchmark_node_insertions(self):
         """Benchmark node insertion performance."""
         
+        node_ids = [f"node_{i}" for i in range(100)]
+        
         def insert_nodes():
-            for i in range(100):
-                self.db.upsert_node(
-                    owner_id="test_agent",
-                    node_id=f"node_{i}",
-                    fsrs_state=None,
-                    timestamp=None
-                )
+            self.db.upsert_nodes_bulk("test_agent", node_ids)
         
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         insert_nodes()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Verify all nodes were inserted
         cursor = self.db.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM kg_nodes WHERE owner_id = 'test_agent'")
+        cursor.execute(COUNT_NODES, ("test_agent",))
         count = cursor.fetchone()[0]
         assert count == 100
         
@@ -64,29 +129,24 @@ class TestDatabasePerformance:
         """Benchmark edge insertion performance."""
         
         # Pre-create nodes
-        for i in range(10):
-            self.db.upsert_node(f"test_agent", f"node_{i}")
+        self.db.upsert_nodes_bulk("test_agent", [f"node_{i}" for i in range(10)])
+        
+        relations = [
+            (f"node_{i}", "related_to", f"node_{j}", 0.5)
+            for i, j in itertools.permutations(range(10), 2)
+        ]
         
         def insert_edges():
-            for i in range(10):
-                for j in range(10):
-                    if i != j:
-                        self.db.add_relation(
-                            owner_id="test_agent",
-                            source=f"node_{i}",
-                            target=f"node_{j}",
-                            relation="related_to",
-                            sentiment=0.5
-                        )
+            self.db.add_relations_bulk("test_agent", relations)
         
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         insert_edges()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Verify edges were inserted
         cursor = self.db.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM kg_edges WHERE owner_id = 'test_agent'")
+        cursor.execute(COUNT_EDGES, ("test_agent",))
         count = cursor.fetchone()[0]
         assert count == 90  # 10 * 9 (no self-loops)
         
@@ -96,21 +156,23 @@ class TestDatabasePerformance:
     def test_benchmark_query_by_owner(self):
         """Benchmark querying nodes by owner."""
         
-        # Pre-create data
-        for i in range(100):
-            self.db.upsert_node(f"agent_{i % 5}", f"node_{i}")
+        # Pre-create data: 20 nodes for each of 5 owners, one batch per owner
+        for owner in range(5):
+            self.db.upsert_nodes_bulk(
+                f"agent_{owner}", [f"node_{i}" for i in range(owner, 100, 5)]
+            )
+        
+        # kg_nodes is clustered on (owner_id, id), so the owner lookup is a
+        # single range walk of the table's own B-tree with no row lookups
+        assert_uses_index(self.db.conn, QUERY_NODES_BY_OWNER, ("agent_0",), index_only=True)
         
         def query_nodes():
-            cursor = self.db.conn.cursor()
-            cursor.execute("""
-                SELECT * FROM kg_nodes WHERE owner_id = 'agent_0'
-            """)
-            return cursor.fetchall()
+            return self.db.list_nodes_by_owner("agent_0")
         
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         result = query_nodes()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         assert len(result) == 20  # 100 / 5
         
@@ -121,32 +183,21 @@ class TestDatabasePerformance:
         """Benchmark temporal queries on edges."""
         
         # Pre-create data
-        for i in range(10):
-            self.db.upsert_node(f"test_agent", f"node_{i}")
-        
-        for i in range(50):
-            self.db.add_relation(
-                owner_id="test_agent",
-                source=f"node_{i % 10}",
-                target=f"node_{(i + 1) % 10}",
-                relation="related",
-                sentiment=0.0
-            )
+        seed_edges(self.db, "test_agent")
+        
+        assert_uses_index(
+            self.db.conn, QUERY_RECENT_EDGES, ("test_agent",), "idx_kg_edges_created"
+        )
         
         def query_recent():
             cursor = self.db.conn.cursor()
-            cursor.execute("""
-                SELECT * FROM kg_edges 
-                WHERE owner_id = 'test_agent'
-                ORDER BY created_at DESC 
-                LIMIT 20
-            """)
+            cursor.execute(QUERY_RECENT_EDGES, ("test_agent",))
             return cursor.fetchall()
         
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         result = query_recent()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should return 20 results (or 10 if there are fewer unique edges)
         # Note: With 10 nodes and no self-loops, we have 10*9=90 total, 
@@ -157,99 +208,40 @@ class TestDatabasePerformance:
         assert elapsed < 1.0, f"Temporal query took too long: {elapsed}s"
 
 
-class TestCachingPerformance:
-    """Benchmark caching performance."""
-    
-    def test_benchmark_cache_hit(self):
-        """Benchmark cache hit performance."""
-        cache = AgentCache(max_size=256, enabled=True)
-        
-        # Pre-populate cache
-        cache.put_context("Alice", "climate", "Context data about climate...")
-        
-        def get_cached():
-            return cache.get_context("Alice", "climate")
-        
-        # Time the operation
-        start = time.time()
-        for _ in range(1000):
-            result = get_cached()
-        elapsed = time.time() - start
-        
-        assert result == "Context data about climate..."
-        
-        # Basic performance check
-        assert elapsed < 0.1, f"Cache hits took too long: {elapsed}s"
-    
-    def test_benchmark_cache_miss(self):
-        """Benchmark cache miss performance."""
-        cache = AgentCache(max_size=256, enabled=True)
-        
-        def get_uncached():
-            return cache.get_context("Alice", "nonexistent")
-        
-        # Time the operation
-        start = time.time()
-        for _ in range(1000):
-            result = get_uncached()
-        elapsed = time.time() - start
-        
-        assert result is None
-        
-        # Basic performance check
-        assert elapsed < 0.1, f"Cache misses took too long: {elapsed}s"
-    
-    def test_benchmark_cache_eviction(self):
-        """Benchmark cache with eviction."""
-        cache = AgentCache(max_size=10, enabled=True)
-        
-        def fill_and_overflow():
-            # Fill cache beyond max_size
-            for i in range(20):
-                cache.put_context(f"Agent_{i}", "topic", f"context_{i}")
-        
-        # Time the operation
-        start = time.time()
-        fill_and_overflow()
-        elapsed = time.time() - start
-        
-        # Verify cache size is at max
-        stats = cache.get_stats()
-        assert stats["context_entries"] <= 10
-        
-        # Basic performance check
-        assert elapsed < 1.0, f"Cache eviction took too long: {elapsed}s"
-
-
 class TestAgentManagerPerformance:
     """Benchmark AgentManager operations."""
     
-    def setup_method(self):
-        """Set up test manager."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        self.manager = AgentManager(db_path=self.db_path)
+    @pytest.fixture(autouse=True)
+    def _use_manager(self, fresh_manager):
+        """Expose the shared manager."""
+        self.manager = fresh_manager
     
-    def teardown_method(self):
-        """Clean up."""
-        # Manager doesn't have a close method
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+    @pytest.mark.skipif(TEST_DB == ":memory:", reason="WAL only applies to file databases")
+    def test_file_database_uses_wal(self):
+        """Test a file database runs in WAL mode."""
+        cursor = self.manager.db.conn.cursor()
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
     
     def test_benchmark_agent_creation(self):
         """Benchmark agent creation."""
         
+        # Unique names come from a counter rather than the clock
+        counter = itertools.count()
+        
         def create_agent():
-            agent_name = f"Agent_{time.time()}"
+            agent_name = f"Agent_{next(counter)}"
             self.manager.create_agent(agent_name)
             return agent_name
         
+        # Warm up (first engine connection, mapper configuration)
+        create_agent()
+        
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(10):
             result = create_agent()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         assert result is not None
         
@@ -270,15 +262,59 @@ class TestAgentManagerPerformance:
                 triplets=[("climate", "related_to", "change")]
             )
         
+        # Warm up
+        absorb()
+        
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(10):
             absorb()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Basic performance check
         assert elapsed < 5.0, f"Content absorption took too long: {elapsed}s"
     
+    def test_benchmark_bulk_content_absorption(self):
+        """Benchmark batched content absorption."""
+        
+        # Create agent
+        self.manager.create_agent("TestAgent")
+        items = [
+            (
+                f"This is test content {i} about climate change.",
+                "Author",
+                [("climate", "related_to", f"change_{i}")],
+            )
+            for i in range(100)
+        ]
+        
+        # Time the operation
+        start = time.perf_counter()
+        self.manager.absorb_content_bulk("TestAgent", items)
+        elapsed = time.perf_counter() - start
+        
+        # Basic performance check
+        assert elapsed < 5.0, f"Bulk content absorption took too long: {elapsed}s"
+    
+    def test_benchmark_raw_triplet_ingestion(self):
+        """Benchmark raw triplet ingestion (no normalization or FSRS review)."""
+        
+        # Create agent
+        self.manager.create_agent("TestAgent")
+        triplets = [("climate", "related_to", f"change_{i}") for i in range(100)]
+        
+        # Time the operation
+        start = time.perf_counter()
+        self.manager.ingest_triplets_raw("TestAgent", triplets)
+        elapsed = time.perf_counter() - start
+        
+        cursor = self.manager.db.conn.cursor()
+        cursor.execute(COUNT_EDGES, ("TestAgent",))
+        assert cursor.fetchone()[0] == 100
+        
+        # Basic performance check
+        assert elapsed < 5.0, f"Raw triplet ingestion took too long: {elapsed}s"
+    
     def test_benchmark_context_retrieval(self):
         """Benchmark context retrieval."""
         
@@ -295,11 +331,14 @@ class TestAgentManagerPerformance:
         def get_context():
             return self.manager.get_context("TestAgent", "climate")
         
+        # Warm up
+        get_context()
+        
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(10):
             result = get_context()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         assert "climate" in result.lower() or "CLIMATE" in result
         
@@ -310,53 +349,54 @@ class TestAgentManagerPerformance:
 class TestEndToEndPerformance:
     """Benchmark end-to-end workflows."""
     
-    def setup_method(self):
-        """Set up test manager."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        self.manager = AgentManager(db_path=self.db_path)
-    
-    def teardown_method(self):
-        """Clean up."""
-        # Manager doesn't have a close method
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+    @pytest.fixture(autouse=True)
+    def _use_manager(self, fresh_manager):
+        """Expose the shared manager."""
+        self.manager = fresh_manager
     
     def test_benchmark_multi_round_conversation(self):
         """Benchmark multi-round conversation workflow."""
         
+        # Create the agents outside the timed region
+        self.manager.create_agent("Alice")
+        self.manager.create_agent("Bob")
+        
+        # Build each round's inputs up front: (text, response, content triplets,
+        # response triplets as (relation, target, sentiment))
+        rounds = [
+            (
+                f"Technology discussion round {round_num}",
+                f"Response to round {round_num}",
+                [("technology", "discussed_in", f"round_{round_num}")],
+                [("responded", f"round_{round_num}", 0.5)],
+            )
+            for round_num in range(5)
+        ]
+        
         def conversation():
-            # Create two agents
-            self.manager.create_agent("Alice")
-            self.manager.create_agent("Bob")
-            
             # Multi-round interaction
-            for round_num in range(5):
+            for text, response, content_triplets, response_triplets in rounds:
                 # Alice processes content
                 context = self.manager.process_and_get_context(
                     agent_name="Alice",
                     topic="technology",
-                    text=f"Technology discussion round {round_num}",
+                    text=text,
                     author="Bob",
-                    triplets=[("technology", "discussed_in", f"round_{round_num}")]
+                    triplets=content_triplets
                 )
                 
-                # Alice generates response (simulated)
-                response = f"Response to round {round_num}"
-                
-                # Update Alice's KG with response (relation, target, sentiment)
+                # Update Alice's KG with her (simulated) response
                 self.manager.update_with_response(
                     agent_name="Alice",
                     response=response,
                     context=context,
-                    triplets=[("responded", f"round_{round_num}", 0.5)]
+                    triplets=response_triplets
                 )
         
         # Time the operation
-        start = time.time()
+        start = time.perf_counter()
         conversation()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Basic performance check
         assert elapsed < 10.0, f"Multi-round conversation took too long: {elapsed}s"
@@ -0,0 +1,81 @@
+"""
+Performance benchmarks for the GhostKG agent cache.
+
+These benchmarks exercise AgentCache only and never touch SQLite, so the
+timed regions measure pure in-process cost without per-test file setup.
+
+Run with: pytest tests/performance/test_cache_benchmarks.py -v
+"""
+
+import time
+from ghost_kg import AgentCache
+
+
+class TestCachingPerformance:
+    """Benchmark caching performance."""
+    
+    def test_benchmark_cache_hit(self):
+        """Benchmark cache hit performance."""
+        cache = AgentCache(max_size=256, enabled=True)
+        
+        # Pre-populate cache
+        cache.put_context("Alice", "climate", "Context data about climate...")
+        
+        def get_cached():
+            return cache.get_context("Alice", "climate")
+        
+        # Warm up
+        get_cached()
+        
+        # Time the operation
+        start = time.perf_counter()
+        for _ in range(1000):
+            result = get_cached()
+        elapsed = time.perf_counter() - start
+        
+        assert result == "Context data about climate..."
+        
+        # Basic performance check
+        assert elapsed < 0.1, f"Cache hits took too long: {elapsed}s"
+    
+    def test_benchmark_cache_miss(self):
+        """Benchmark cache miss performance."""
+        cache = AgentCache(max_size=256, enabled=True)
+        
+        def get_uncached():
+            return cache.get_context("Alice", "nonexistent")
+        
+        # Warm up
+        get_uncached()
+        
+        # Time the operation
+        start = time.perf_counter()
+        for _ in range(1000):
+            result = get_uncached()
+        elapsed = time.perf_counter() - start
+        
+        assert result is None
+        
+        # Basic performance check
+        assert elapsed < 0.1, f"Cache misses took too long: {elapsed}s"
+    
+    def test_benchmark_cache_eviction(self):
+        """Benchmark cache with eviction."""
+        cache = AgentCache(max_size=10, enabled=True)
+        
+        def fill_and_overflow():
+            # Fill cache beyond max_size
+            for i in range(20):
+                cache.put_context(f"Agent_{i}", "topic", f"context_{i}")
+        
+        # Time the operation
+        start = time.perf_counter()
+        fill_and_overflow()
+        elapsed = time.perf_counter() - start
+        
+        # Verify cache size is at max
+        stats = cache.get_stats()
+        assert stats["context_entries"] <= 10
+        
+        # Basic performance check
+        assert elapsed < 1.0, f"Cache eviction took too long: {elapsed}s"
@@ -1,7 +1,9 @@
 """Performance tests for memory management."""
 import pytest
 import datetime
+import gc
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ghost_kg import AgentManager, Rating
 
 
@@ -23,22 +25,26 @@ class TestMemoryPerformance:
         now = datetime.datetime.now(datetime.timezone.utc)
         manager.set_agent_time(agent_name, now)
         
-        # Insert 1000 triplets
-        start = time.time()
-        for i in range(1000):
-            manager.learn_triplet(
-                agent_name,
-                f"entity{i}",
-                "relates_to",
-                f"concept{i}",
-                rating=Rating.Good
-            )
-        insert_time = time.time() - start
+        # Build the payload outside the timed region
+        pairs = [(f"entity{i}", f"concept{i}") for i in range(1000)]
+        
+        # Insert 1000 triplets in one transaction
+        start = time.perf_counter()
+        with manager.db.transaction():
+            for entity, concept in pairs:
+                manager.learn_triplet(
+                    agent_name,
+                    entity,
+                    "relates_to",
+                    concept,
+                    rating=Rating.Good
+                )
+        insert_time = time.perf_counter() - start
         
         # Query should be fast even with 1000 triplets
-        start = time.time()
+        start = time.perf_counter()
         context = manager.get_context(agent_name, "entity500")
-        query_time = time.time() - start
+        query_time = time.perf_counter() - start
         
         # Assertions about performance
         assert insert_time < 15.0, f"Insertion took too long: {insert_time}s"
@@ -55,30 +61,23 @@ class TestMemoryPerformance:
         now = datetime.datetime.now(datetime.timezone.utc)
         manager.set_agent_time(agent_name, now)
         
+        triplets = [(f"topic{i}", "is", "interesting") for i in range(100)]
+        
         # Learn 100 triplets
-        for i in range(100):
-            manager.learn_triplet(
-                agent_name,
-                f"topic{i}",
-                "is",
-                "interesting",
-                rating=Rating.Good
-            )
-        
-        # Advance time and re-learn (triggering decay calculations)
+        agent.learn_triplets(triplets, rating=Rating.Good)
+        
+        # Advance time and re-learn (triggering decay calculations). The batch
+        # fetches all node states in one query, replays FSRS in memory and
+        # writes the new states back in one bulk upsert.
         later = now + datetime.timedelta(days=7)
         manager.set_agent_time(agent_name, later)
         
-        start = time.time()
-        for i in range(100):
-            manager.learn_triplet(
-                agent_name,
-                f"topic{i}",
-                "is",
-                "interesting",
-                rating=Rating.Easy
-            )
-        review_time = time.time() - start
+        start = time.perf_counter()
+        agent.learn_triplets(triplets, rating=Rating.Easy)
+        review_time = time.perf_counter() - start
+        
+        reviewed = manager.db.get_node(agent_name, "topic0")
+        assert reviewed["reps"] == 2
         
         # Reviews should be fast
         assert review_time < 2.0, f"Review took too long: {review_time}s"
@@ -104,11 +103,11 @@ class TestMemoryPerformance:
                 )
         
         # Get context for each topic
-        start = time.time()
+        start = time.perf_counter()
         for topic in topics:
             context = manager.get_context(agent_name, topic)
             assert len(context) > 0
-        total_time = time.time() - start
+        total_time = time.perf_counter() - start
         
         # Should be able to generate 5 contexts quickly
         assert total_time < 2.0, f"Context generation took too long: {total_time}s"
@@ -121,16 +120,23 @@ class TestMemoryPerformance:
         now = datetime.datetime.now(datetime.timezone.utc)
         manager.set_agent_time(agent_name, now)
         
-        # Absorb 100 messages
-        start = time.time()
-        for i in range(100):
-            manager.absorb_content(
-                agent_name,
-                f"Message {i} about topic",
-                author=f"User{i % 10}",
-                triplets=[(f"Message{i}", "is_about", "topic")]
-            )
-        absorb_time = time.time() - start
+        # Build the messages outside the timed region
+        messages = [
+            (f"Message {i} about topic", f"User{i % 10}", [(f"Message{i}", "is_about", "topic")])
+            for i in range(100)
+        ]
+        
+        # Absorb 100 messages in one transaction
+        start = time.perf_counter()
+        with manager.db.transaction():
+            for content, author, triplets in messages:
+                manager.absorb_content(
+                    agent_name,
+                    content,
+                    author=author,
+                    triplets=triplets
+                )
+        absorb_time = time.perf_counter() - start
         
         # Should process 100 messages quickly
         assert absorb_time < 5.0, f"Absorbing 100 messages took too long: {absorb_time}s"
@@ -138,25 +144,30 @@ class TestMemoryPerformance:
     def test_memory_growth_over_time(self, manager):
         """Test that memory usage grows linearly with knowledge base size."""
         agent_name = "GrowthAgent"
-        agent = manager.create_agent(agent_name)
+        manager.create_agent(agent_name)
         
         now = datetime.datetime.now(datetime.timezone.utc)
         manager.set_agent_time(agent_name, now)
         
+        # Build all batches outside the timed regions
+        batches = [
+            [
+                (f"entity{idx}", "is", f"concept{idx}")
+                for idx in range(batch * 100, (batch + 1) * 100)
+            ]
+            for batch in range(5)
+        ]
+        
+        # Collect garbage left by earlier tests so a full collection does not
+        # land inside the first (now only tens of milliseconds long) batch
+        gc.collect()
+        
         # Add memories in batches and time each batch
         batch_times = []
-        for batch in range(5):
-            start = time.time()
-            for i in range(100):
-                idx = batch * 100 + i
-                manager.learn_triplet(
-                    agent_name,
-                    f"entity{idx}",
-                    "is",
-                    f"concept{idx}",
-                    rating=Rating.Good
-                )
-            batch_time = time.time() - start
+        for pairs in batches:
+            start = time.perf_counter()
+            manager.learn_triplets(agent_name, pairs, rating=Rating.Good)
+            batch_time = time.perf_counter() - start
             batch_times.append(batch_time)
         
         # Each batch should take similar time (linear growth, not exponential)
@@ -175,9 +186,7 @@ class TestMemoryPerformance:
         
         now = datetime.datetime.now(datetime.timezone.utc)
         
-        # Each agent learns and queries
-        start = time.time()
-        for name in agent_names:
+        def work_one_agent(name):
             manager.set_agent_time(name, now)
             for i in range(10):
                 manager.learn_triplet(
@@ -187,9 +196,18 @@ class TestMemoryPerformance:
                     "true",
                     rating=Rating.Good
                 )
-            context = manager.get_context(name, "fact5")
+            return manager.get_context(name, "fact5")
+        
+        # Each agent learns and queries on its own thread; every KnowledgeDB
+        # call checks out its own pooled connection, and WAL lets the readers
+        # run while another agent's write is in progress
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            contexts = list(executor.map(work_one_agent, agent_names))
+        total_time = time.perf_counter() - start
+        
+        for context in contexts:
             assert len(context) > 0
-        total_time = time.time() - start
         
         # 10 agents × 10 triplets + 10 queries should be fast
         assert total_time < 5.0, f"Multi-agent operations took too long: {total_time}s"
@@ -2,7 +2,7 @@
 
 import os
 import json
-import tempfile
+import re
 import pytest
 from pathlib import Path
 
@@ -16,6 +16,28 @@ from ghost_kg import (
     ConfigurationError,
 )
 
+# Error-message patterns, compiled once for every pytest.raises(match=...)
+RE_EXACT_21 = re.compile("exactly 21 values")
+RE_NUMERIC = re.compile("must be numeric")
+RE_LIST = re.compile("must be a list")
+RE_EMPTY = re.compile("cannot be empty")
+RE_POSITIVE = re.compile("must be positive")
+RE_AT_LEAST_1 = re.compile("must be at least 1")
+RE_INVALID_JSON = re.compile("Invalid JSON")
+RE_NOT_FOUND = re.compile("not found")
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Shared default GhostKGConfig; tests must not mutate it."""
+    return GhostKGConfig()
+
+
+@pytest.fixture(scope="session")
+def default_config_dict(default_config):
+    """Dictionary form of the shared default configuration."""
+    return default_config.to_dict()
+
 
 class TestFSRSConfig:
     """Test FSRS configuration."""
@@ -32,22 +54,19 @@ class TestFSRSConfig:
         config = FSRSConfig(parameters=params)
         assert config.parameters == params
     
-    def test_validation_wrong_count(self):
-        """Test validation fails with wrong parameter count."""
-        config = FSRSConfig(parameters=[1.0] * 10)
-        with pytest.raises(ConfigurationError, match="exactly 21 values"):
-            config.validate()
-    
-    def test_validation_non_numeric(self):
-        """Test validation fails with non-numeric parameters."""
-        config = FSRSConfig(parameters=[1.0] * 20 + ["invalid"])
-        with pytest.raises(ConfigurationError, match="must be numeric"):
-            config.validate()
-    
-    def test_validation_not_list(self):
-        """Test validation fails when parameters is not a list."""
-        config = FSRSConfig(parameters="invalid")
-        with pytest.raises(ConfigurationError, match="must be a list"):
+    @pytest.mark.parametrize(
+        "params,msg",
+        [
+            ([1.0] * 10, RE_EXACT_21),
+            ([1.0] * 20 + ["invalid"], RE_NUMERIC),
+            ("invalid", RE_LIST),
+        ],
+        ids=["wrong_count", "non_numeric", "not_list"],
+    )
+    def test_validation(self, params, msg):
+        """Test validation rejects malformed parameters."""
+        config = FSRSConfig(parameters=params)
+        with pytest.raises(ConfigurationError, match=msg):
             config.validate()
 
 
@@ -72,16 +91,18 @@ class TestDatabaseConfig:
         assert config.check_same_thread is True
         assert config.timeout == 10.0
     
-    def test_validation_empty_path(self):
-        """Test validation fails with empty path."""
-        config = DatabaseConfig(path="")
-        with pytest.raises(ConfigurationError, match="cannot be empty"):
-            config.validate()
-    
-    def test_validation_negative_timeout(self):
-        """Test validation fails with negative timeout."""
-        config = DatabaseConfig(timeout=-1.0)
-        with pytest.raises(ConfigurationError, match="must be positive"):
+    @pytest.mark.parametrize(
+        "kwargs,msg",
+        [
+            ({"path": ""}, RE_EMPTY),
+            ({"timeout": -1.0}, RE_POSITIVE),
+        ],
+        ids=["empty_path", "negative_timeout"],
+    )
+    def test_validation(self, kwargs, msg):
+        """Test validation rejects invalid settings."""
+        config = DatabaseConfig(**kwargs)
+        with pytest.raises(ConfigurationError, match=msg):
             config.validate()
 
 
@@ -109,22 +130,19 @@ class TestLLMConfig:
         assert config.timeout == 60
         assert config.max_retries == 5
     
-    def test_validation_empty_host(self):
-        """Test validation fails with empty host."""
-        config = LLMConfig(host="")
-        with pytest.raises(ConfigurationError, match="cannot be empty"):
-            config.validate()
-    
-    def test_validation_negative_timeout(self):
-        """Test validation fails with negative timeout."""
-        config = LLMConfig(timeout=-1)
-        with pytest.raises(ConfigurationError, match="must be positive"):
-            config.validate()
-    
-    def test_validation_zero_retries(self):
-        """Test validation fails with zero retries."""
-        config = LLMConfig(max_retries=0)
-        with pytest.raises(ConfigurationError, match="must be at least 1"):
+    @pytest.mark.parametrize(
+        "kwargs,msg",
+        [
+            ({"host": ""}, RE_EMPTY),
+            ({"timeout": -1}, RE_POSITIVE),
+            ({"max_retries": 0}, RE_AT_LEAST_1),
+        ],
+        ids=["empty_host", "negative_timeout", "zero_retries"],
+    )
+    def test_validation(self, kwargs, msg):
+        """Test validation rejects invalid settings."""
+        config = LLMConfig(**kwargs)
+        with pytest.raises(ConfigurationError, match=msg):
             config.validate()
 
 
@@ -149,29 +167,27 @@ class TestFastModeConfig:
         assert config.entity_labels == ["Custom"]
         assert config.sentiment_thresholds == {"custom": 0.5}
     
-    def test_validation_empty_model(self):
-        """Test validation fails with empty model name."""
-        config = FastModeConfig(gliner_model="")
-        with pytest.raises(ConfigurationError, match="cannot be empty"):
-            config.validate()
-    
-    def test_validation_empty_labels(self):
-        """Test validation fails with empty labels."""
-        config = FastModeConfig(entity_labels=[])
-        with pytest.raises(ConfigurationError, match="cannot be empty"):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"gliner_model": ""}, {"entity_labels": []}],
+        ids=["empty_model", "empty_labels"],
+    )
+    def test_validation(self, kwargs):
+        """Test validation rejects empty settings."""
+        config = FastModeConfig(**kwargs)
+        with pytest.raises(ConfigurationError, match=RE_EMPTY):
             config.validate()
 
 
 class TestGhostKGConfig:
     """Test main GhostKG configuration."""
     
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default GhostKG configuration."""
-        config = GhostKGConfig()
-        assert isinstance(config.fsrs, FSRSConfig)
-        assert isinstance(config.database, DatabaseConfig)
-        assert isinstance(config.llm, LLMConfig)
-        assert isinstance(config.fast_mode, FastModeConfig)
+        assert isinstance(default_config.fsrs, FSRSConfig)
+        assert isinstance(default_config.database, DatabaseConfig)
+        assert isinstance(default_config.llm, LLMConfig)
+        assert isinstance(default_config.fast_mode, FastModeConfig)
     
     def test_custom_config(self):
         """Test custom GhostKG configuration."""
@@ -182,19 +198,20 @@ class TestGhostKGConfig:
         assert config.llm.model == "llama2"
         assert config.database.path == "/custom/path.db"
     
-    def test_validate_all(self):
+    def test_validate_all(self, default_config):
         """Test validation of all sub-configurations."""
-        config = GhostKGConfig()
-        config.validate()  # Should not raise
+        default_config.validate()  # Should not raise
     
-    def test_to_dict(self):
+    def test_to_dict(self, default_config_dict):
         """Test conversion to dictionary."""
-        config = GhostKGConfig()
-        data = config.to_dict()
-        assert "fsrs" in data
-        assert "database" in data
-        assert "llm" in data
-        assert "fast_mode" in data
+        assert "fsrs" in default_config_dict
+        assert "database" in default_config_dict
+        assert "llm" in default_config_dict
+        assert "fast_mode" in default_config_dict
+    
+    def test_from_dict_roundtrip(self, default_config, default_config_dict):
+        """Test a dictionary produced by to_dict loads back to an equal config."""
+        assert GhostKGConfig.from_dict(default_config_dict) == default_config
     
     def test_from_dict_default(self):
         """Test loading from empty dictionary."""
@@ -234,120 +251,85 @@ class TestGhostKGConfig:
         with pytest.raises(ConfigurationError):
             GhostKGConfig.from_dict(data)
     
-    def test_from_env_default(self):
+    def test_from_env_default(self, monkeypatch, default_config):
         """Test loading from environment with no variables set."""
-        # Clear any GHOSTKG_ variables
-        original_env = os.environ.copy()
-        try:
-            for key in list(os.environ.keys()):
-                if key.startswith("GHOSTKG_"):
-                    del os.environ[key]
-            
-            config = GhostKGConfig.from_env()
-            assert isinstance(config, GhostKGConfig)
-            config.validate()
-        finally:
-            os.environ.clear()
-            os.environ.update(original_env)
+        for key in list(os.environ):
+            if key.startswith("GHOSTKG_"):
+                monkeypatch.delenv(key, raising=False)
+        
+        config = GhostKGConfig.from_env()
+        assert config == default_config
+        config.validate()
     
-    def test_from_env_custom(self):
+    def test_from_env_custom(self, monkeypatch):
         """Test loading from environment with custom variables."""
-        original_env = os.environ.copy()
-        try:
-            os.environ["GHOSTKG_LLM_HOST"] = "http://custom:11434"
-            os.environ["GHOSTKG_LLM_MODEL"] = "llama2"
-            os.environ["GHOSTKG_DATABASE_PATH"] = "/custom/path.db"
-            os.environ["GHOSTKG_DATABASE_TIMEOUT"] = "10.5"
-            
-            config = GhostKGConfig.from_env()
-            assert config.llm.host == "http://custom:11434"
-            assert config.llm.model == "llama2"
-            assert config.database.path == "/custom/path.db"
-            assert config.database.timeout == 10.5
-        finally:
-            os.environ.clear()
-            os.environ.update(original_env)
+        # monkeypatch records and restores only the keys it sets
+        for key, value in {
+            "GHOSTKG_LLM_HOST": "http://custom:11434",
+            "GHOSTKG_LLM_MODEL": "llama2",
+            "GHOSTKG_DATABASE_PATH": "/custom/path.db",
+            "GHOSTKG_DATABASE_TIMEOUT": "10.5",
+        }.items():
+            monkeypatch.setenv(key, value)
+        
+        config = GhostKGConfig.from_env()
+        assert config.llm.host == "http://custom:11434"
+        assert config.llm.model == "llama2"
+        assert config.database.path == "/custom/path.db"
+        assert config.database.timeout == 10.5
     
-    def test_from_env_bool_conversion(self):
+    def test_from_env_bool_conversion(self, monkeypatch):
         """Test boolean conversion from environment."""
-        original_env = os.environ.copy()
-        try:
-            os.environ["GHOSTKG_DATABASE_CHECK_SAME_THREAD"] = "true"
-            
-            config = GhostKGConfig.from_env()
-            assert config.database.check_same_thread is True
-        finally:
-            os.environ.clear()
-            os.environ.update(original_env)
+        monkeypatch.setenv("GHOSTKG_DATABASE_CHECK_SAME_THREAD", "true")
+        
+        config = GhostKGConfig.from_env()
+        assert config.database.check_same_thread is True
     
-    def test_from_json_file(self):
-        """Test loading from JSON file."""
+    def test_from_json_string(self):
+        """Test loading from a JSON string."""
         data = {
             "llm": {"model": "llama2"},
             "database": {"path": "/test.db"}
         }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-        
-        try:
-            config = GhostKGConfig.from_json(temp_path)
-            assert config.llm.model == "llama2"
-            assert config.database.path == "/test.db"
-        finally:
-            os.unlink(temp_path)
+        config = GhostKGConfig.from_json_string(json.dumps(data))
+        assert config.llm.model == "llama2"
+        assert config.database.path == "/test.db"
+    
+    def test_from_json_string_invalid(self):
+        """Test loading from an invalid JSON string."""
+        with pytest.raises(ConfigurationError, match=RE_INVALID_JSON):
+            GhostKGConfig.from_json_string("{ invalid json }")
+    
+    @pytest.mark.slow
+    def test_from_json_file_disk(self, tmp_path):
+        """Test the path-based JSON loader end to end."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"llm": {"model": "llama2"}}))
+        config = GhostKGConfig.from_json(str(path))
+        assert config.llm.model == "llama2"
     
     def test_from_json_file_not_found(self):
         """Test loading from non-existent JSON file."""
-        with pytest.raises(ConfigurationError, match="not found"):
+        with pytest.raises(ConfigurationError, match=RE_NOT_FOUND):
             GhostKGConfig.from_json("/nonexistent/config.json")
     
-    def test_from_json_invalid_json(self):
-        """Test loading from invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("{ invalid json }")
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ConfigurationError, match="Invalid JSON"):
-                GhostKGConfig.from_json(temp_path)
-        finally:
-            os.unlink(temp_path)
-    
-    def test_from_yaml_file(self):
-        """Test loading from YAML file."""
-        try:
-            import yaml
-        except ImportError:
-            pytest.skip("PyYAML not installed")
-        
+    def test_from_yaml_string(self):
+        """Test loading from a YAML string."""
+        pytest.importorskip("yaml")
         data = """
         llm:
           model: llama2
         database:
           path: /test.db
         """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(data)
-            temp_path = f.name
-        
-        try:
-            config = GhostKGConfig.from_yaml(temp_path)
-            assert config.llm.model == "llama2"
-            assert config.database.path == "/test.db"
-        finally:
-            os.unlink(temp_path)
+        config = GhostKGConfig.from_yaml_string(data)
+        assert config.llm.model == "llama2"
+        assert config.database.path == "/test.db"
     
     def test_from_yaml_file_not_found(self):
         """Test loading from non-existent YAML file."""
-        try:
-            import yaml
-        except ImportError:
-            pytest.skip("PyYAML not installed")
-        
-        with pytest.raises(ConfigurationError, match="not found"):
+        pytest.importorskip("yaml")
+        with pytest.raises(ConfigurationError, match=RE_NOT_FOUND):
             GhostKGConfig.from_yaml("/nonexistent/config.yaml")
 
 
@@ -1,5 +1,8 @@
 """Tests for dependency checking utilities."""
 
+import sys
+import types
+
 import pytest
 from ghost_kg import (
     DependencyChecker,
@@ -32,6 +35,23 @@ class TestDependencyChecker:
             # Should check for gliner and/or textblob
             assert any(dep in missing for dep in ["gliner", "textblob"])
 
+    @pytest.fixture
+    def fresh_cache(self):
+        """Start from an empty probe cache and clear it again, even if the test fails."""
+        DependencyChecker.reset_cache()
+        yield
+        DependencyChecker.reset_cache()
+
+    def test_checks_are_cached(self, fresh_cache, monkeypatch):
+        """Test availability is probed once until the cache is reset."""
+        monkeypatch.setitem(sys.modules, "ollama", None)  # None makes import fail
+        assert DependencyChecker.check_llm_available() == (False, ["ollama"])
+
+        monkeypatch.setitem(sys.modules, "ollama", types.ModuleType("ollama"))
+        assert DependencyChecker.check_llm_available() == (False, ["ollama"])
+        DependencyChecker.reset_cache()
+        assert DependencyChecker.check_llm_available() == (True, [])
+
     def test_get_available_extractors(self):
         """Test getting list of available extractors."""
         extractors = DependencyChecker.get_available_extractors()
@@ -70,10 +90,13 @@ class TestDependencyChecker:
         assert isinstance(fast_result, bool)
         assert fast_result == DependencyChecker.check_fast_available()[0]
 
-    def test_print_status(self):
-        """Test print_status doesn't crash."""
-        # Should not raise any exceptions
+    def test_print_status(self, capsys):
+        """Test print_status prints the formatted report."""
         DependencyChecker.print_status()
+        out = capsys.readouterr().out
+        assert out == DependencyChecker.format_status() + "\n"
+        assert "LLM mode" in out
+        assert "Fast mode" in out
 
 
 class TestDependencyIntegration:
@@ -4,7 +4,6 @@ Tests for error handling (Phase 3 refactoring).
 This module tests:
 - Custom exceptions
 - Database error handling
-- LLM error handling with retries
 - Input validation
 - Graceful degradation
 """
@@ -12,7 +11,6 @@ This module tests:
 import pytest
 import sqlite3
 import datetime
-from unittest.mock import Mock, patch, MagicMock
 
 from ghost_kg import (
     GhostKGError,
@@ -27,40 +25,48 @@ from ghost_kg import (
 from ghost_kg import KnowledgeDB, NodeState, AgentManager
 
 
+@pytest.fixture(scope="class")
+def db():
+    """One in-memory KnowledgeDB for tests that only trigger validation errors."""
+    db = KnowledgeDB(":memory:")
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="class")
+def manager():
+    """One in-memory AgentManager with ``test_agent``, shared by validation tests.
+
+    Validation errors are raised before any state changes, so the tests
+    cannot affect each other.
+    """
+    manager = AgentManager(":memory:")
+    manager.create_agent("test_agent")
+    yield manager
+    manager.db.close()
+
+
 class TestCustomExceptions:
     """Test custom exception hierarchy."""
     
-    def test_base_exception(self):
-        """Test GhostKGError is a proper Exception."""
-        error = GhostKGError("test error")
-        assert isinstance(error, Exception)
-        assert str(error) == "test error"
-    
-    def test_database_error(self):
-        """Test DatabaseError inherits from GhostKGError."""
-        error = DatabaseError("database failed")
+    @pytest.mark.parametrize("error_cls", [
+        GhostKGError,
+        DatabaseError,
+        LLMError,
+        ExtractionError,
+        ConfigurationError,
+        AgentNotFoundError,
+        ValidationError,
+        DependencyError,
+    ])
+    def test_exception_hierarchy(self, error_cls):
+        """Test each error is catchable as GhostKGError and keeps its message."""
+        msg = "This is a test error message"
+        error = error_cls(msg)
         assert isinstance(error, GhostKGError)
         assert isinstance(error, Exception)
-    
-    def test_llm_error(self):
-        """Test LLMError inherits from GhostKGError."""
-        error = LLMError("llm failed")
-        assert isinstance(error, GhostKGError)
-    
-    def test_extraction_error(self):
-        """Test ExtractionError inherits from GhostKGError."""
-        error = ExtractionError("extraction failed")
-        assert isinstance(error, GhostKGError)
-    
-    def test_validation_error(self):
-        """Test ValidationError inherits from GhostKGError."""
-        error = ValidationError("validation failed")
-        assert isinstance(error, GhostKGError)
-    
-    def test_agent_not_found_error(self):
-        """Test AgentNotFoundError inherits from GhostKGError."""
-        error = AgentNotFoundError("agent not found")
-        assert isinstance(error, GhostKGError)
+        assert str(error) == msg
+        assert error.args[0] == msg
 
 
 class TestDatabaseErrorHandling:
@@ -73,10 +79,8 @@ class TestDatabaseErrorHandling:
         db = KnowledgeDB(":memory:")
         assert db.conn is not None
     
-    def test_upsert_node_validation(self):
+    def test_upsert_node_validation(self, db):
         """Test upsert_node with invalid parameters."""
-        db = KnowledgeDB(":memory:")
-        
         # Empty owner_id
         with pytest.raises(ValidationError, match="owner_id and node_id are required"):
             db.upsert_node("", "node1")
@@ -85,10 +89,8 @@ class TestDatabaseErrorHandling:
         with pytest.raises(ValidationError, match="owner_id and node_id are required"):
             db.upsert_node("agent1", "")
     
-    def test_add_relation_validation(self):
+    def test_add_relation_validation(self, db):
         """Test add_relation with invalid parameters."""
-        db = KnowledgeDB(":memory:")
-        
         # Empty owner_id
         with pytest.raises(ValidationError):
             db.add_relation("", "source", "relation", "target")
@@ -100,10 +102,8 @@ class TestDatabaseErrorHandling:
         with pytest.raises(ValidationError, match="sentiment must be between"):
             db.add_relation("agent1", "source", "relation", "target", sentiment=-2.0)
     
-    def test_log_interaction_validation(self):
+    def test_log_interaction_validation(self, db):
         """Test log_interaction with invalid parameters."""
-        db = KnowledgeDB(":memory:")
-        
         # Empty agent name
         with pytest.raises(ValidationError, match="agent and action are required"):
             db.log_interaction("", "action", "content", {})
@@ -133,80 +133,41 @@ class TestDatabaseErrorHandling:
 class TestManagerValidation:
     """Test input validation in AgentManager."""
     
-    def test_create_agent_validation(self):
-        """Test create_agent with invalid parameters."""
-        manager = AgentManager(":memory:")
-        
-        # Empty name
-        with pytest.raises(ValidationError, match="Agent name must be a non-empty string"):
-            manager.create_agent("")
-        
-        # None name
-        with pytest.raises(ValidationError, match="Agent name must be a non-empty string"):
-            manager.create_agent(None)
-    
-    def test_set_agent_time_validation(self):
-        """Test set_agent_time with invalid parameters."""
-        manager = AgentManager(":memory:")
-        manager.create_agent("test_agent")
-        
-        # Invalid time type
-        with pytest.raises(ValidationError, match="time must be a datetime object"):
-            manager.set_agent_time("test_agent", "not a datetime")
-        
-        # Non-existent agent
-        with pytest.raises(AgentNotFoundError, match="Agent 'nonexistent' not found"):
-            manager.set_agent_time("nonexistent", datetime.datetime.now())
-    
-    def test_absorb_content_validation(self):
-        """Test absorb_content with invalid parameters."""
-        manager = AgentManager(":memory:")
-        manager.create_agent("test_agent")
-        
-        # Empty content
-        with pytest.raises(ValidationError, match="content must be a non-empty string"):
-            manager.absorb_content("test_agent", "")
-        
-        # Invalid triplets format
-        with pytest.raises(ValidationError, match="triplets must be a list"):
-            manager.absorb_content("test_agent", "content", triplets="not a list")
-        
-        # Invalid triplet structure
-        with pytest.raises(ValidationError, match="Each triplet must be a 3-tuple"):
-            manager.absorb_content("test_agent", "content", triplets=[("source", "relation")])
-        
-        # Non-existent agent
-        with pytest.raises(AgentNotFoundError, match="Agent 'nonexistent' not found"):
-            manager.absorb_content("nonexistent", "content")
-    
-    def test_get_context_validation(self):
-        """Test get_context with invalid parameters."""
-        manager = AgentManager(":memory:")
-        manager.create_agent("test_agent")
-        
-        # Empty topic
-        with pytest.raises(ValidationError, match="topic must be a non-empty string"):
-            manager.get_context("test_agent", "")
-        
-        # Non-existent agent
-        with pytest.raises(AgentNotFoundError, match="Agent 'nonexistent' not found"):
-            manager.get_context("nonexistent", "topic")
-
-
-class TestLLMErrorHandling:
-    """Test LLM error handling with retries."""
-    
-    @patch('ghost_kg.core.cognitive.CognitiveLoop._call_llm_with_retry')
-    def test_llm_retry_logic(self, mock_call):
-        """Test that LLM calls are retried on failure."""
-        # This is a unit test for the retry logic
-        # We'll test the actual retry behavior
-        pass  # Implementation would require mocking
-    
-    def test_llm_error_raised_after_retries(self):
-        """Test that LLMError is raised after max retries."""
-        # This would test the actual retry implementation
-        pass  # Implementation would require mocking
+    @pytest.mark.parametrize("op, args, kwargs, exc, match", [
+        ("create_agent", ("",), {}, ValidationError, "Agent name must be a non-empty string"),
+        ("create_agent", (None,), {}, ValidationError, "Agent name must be a non-empty string"),
+        ("set_agent_time", ("test_agent", "not a datetime"), {},
+         ValidationError, "time must be a datetime object"),
+        ("set_agent_time", ("nonexistent", datetime.datetime(2025, 1, 1)), {},
+         AgentNotFoundError, "Agent 'nonexistent' not found"),
+        ("absorb_content", ("test_agent", ""), {},
+         ValidationError, "content must be a non-empty string"),
+        ("absorb_content", ("test_agent", "content"), {"triplets": "not a list"},
+         ValidationError, "triplets must be a list"),
+        ("absorb_content", ("test_agent", "content"), {"triplets": [("source", "relation")]},
+         ValidationError, "Each triplet must be a 3-tuple"),
+        ("absorb_content", ("nonexistent", "content"), {},
+         AgentNotFoundError, "Agent 'nonexistent' not found"),
+        ("get_context", ("test_agent", ""), {},
+         ValidationError, "topic must be a non-empty string"),
+        ("get_context", ("nonexistent", "topic"), {},
+         AgentNotFoundError, "Agent 'nonexistent' not found"),
+    ], ids=[
+        "create_agent-empty",
+        "create_agent-none",
+        "set_agent_time-not-datetime",
+        "set_agent_time-unknown-agent",
+        "absorb_content-empty",
+        "absorb_content-triplets-not-list",
+        "absorb_content-short-triplet",
+        "absorb_content-unknown-agent",
+        "get_context-empty-topic",
+        "get_context-unknown-agent",
+    ])
+    def test_validation(self, manager, op, args, kwargs, exc, match):
+        """Test each manager call rejects invalid input before changing state."""
+        with pytest.raises(exc, match=match):
+            getattr(manager, op)(*args, **kwargs)
 
 
 class TestGracefulDegradation:
@@ -217,40 +178,14 @@ class TestGracefulDegradation:
         # This tests that the code doesn't crash when optional deps are missing
         from ghost_kg import DependencyChecker
         
-        # Check status shouldn't crash
-        DependencyChecker.print_status()
+        # Building the status report shouldn't crash; module probes are
+        # cached by DependencyChecker, so this costs one probe per session
+        assert "Dependency Status" in DependencyChecker.format_status()
         
         # Getting available extractors shouldn't crash
         extractors = DependencyChecker.get_available_extractors()
         assert isinstance(extractors, list)
 
 
-def test_error_hierarchy():
-    """Test that all custom errors can be caught by base exception."""
-    errors = [
-        DatabaseError("test"),
-        LLMError("test"),
-        ExtractionError("test"),
-        ConfigurationError("test"),
-        AgentNotFoundError("test"),
-        ValidationError("test"),
-        DependencyError("test"),
-    ]
-    
-    for error in errors:
-        # All should be catchable as GhostKGError
-        assert isinstance(error, GhostKGError)
-        # All should be catchable as Exception
-        assert isinstance(error, Exception)
-
-
-def test_error_messages():
-    """Test that error messages are preserved."""
-    msg = "This is a test error message"
-    error = DatabaseError(msg)
-    assert str(error) == msg
-    assert error.args[0] == msg
-
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
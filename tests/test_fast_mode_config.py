@@ -1,55 +1,51 @@
-#!/usr/bin/env python3
 """
-Test script to verify fast_mode configuration works correctly
+Tests that the fast_mode configuration of examples/use_case_example.py is in place.
+
+The example is parsed, not imported, so its optional dependencies are not needed.
 """
 
-import sys
-import os
-
-# Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-# Test that the file can be imported and configuration is accessible
-print("Testing use_case_example.py configuration...")
-
-# Import the module
-import importlib.util
-spec = importlib.util.spec_from_file_location(
-    "use_case_example",
-    os.path.join(os.path.dirname(__file__), "..", "examples", "use_case_example.py")
-)
-use_case_module = importlib.util.module_from_spec(spec)
-
-# Check if USE_FAST_MODE is defined by partially executing the module
-# (we'll just parse it to check the configuration exists)
-with open(os.path.join(os.path.dirname(__file__), "..", "examples", "use_case_example.py"), 'r') as f:
-    content = f.read()
-    
-print("\n✓ Configuration Check:")
-if "USE_FAST_MODE" in content:
-    print("  ✓ USE_FAST_MODE configuration variable found")
-    
-    # Check default value
-    if "USE_FAST_MODE = True" in content:
-        print("  ✓ Default value is True (Fast Mode)")
-    else:
-        print("  ✓ USE_FAST_MODE is defined (check value manually)")
-else:
-    print("  ✗ USE_FAST_MODE not found")
-    
-# Check if conditional logic exists
-if "if USE_FAST_MODE:" in content:
-    print("  ✓ Conditional logic for fast_mode found")
-else:
-    print("  ✗ Conditional logic not found")
-
-# Check if documentation exists
-if "CONFIGURATION:" in content and "Fast Mode vs LLM Mode" in content:
-    print("  ✓ Configuration documentation found")
-else:
-    print("  ✗ Configuration documentation not found")
-
-print("\n✓ All checks passed!")
-print("\nTo use the example:")
-print("  - Fast Mode (default): Set USE_FAST_MODE = True")
-print("  - LLM Mode: Set USE_FAST_MODE = False")
+import ast
+import functools
+from pathlib import Path
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "use_case_example.py"
+
+
+@functools.lru_cache(maxsize=None)
+def example_source():
+    """Read the example once for every test."""
+    return EXAMPLE.read_text()
+
+
+@functools.lru_cache(maxsize=None)
+def example_tree():
+    """Parse the example once for every test."""
+    return ast.parse(example_source())
+
+
+def test_use_fast_mode_defined():
+    """Test USE_FAST_MODE is assigned a boolean at module level."""
+    values = [
+        node.value.value
+        for node in example_tree().body
+        if isinstance(node, ast.Assign)
+        and any(isinstance(t, ast.Name) and t.id == "USE_FAST_MODE" for t in node.targets)
+        and isinstance(node.value, ast.Constant)
+    ]
+    assert len(values) == 1, "USE_FAST_MODE should be set exactly once"
+    assert isinstance(values[0], bool)
+
+
+def test_use_fast_mode_branch():
+    """Test the example branches on USE_FAST_MODE."""
+    assert any(
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Name)
+        and node.test.id == "USE_FAST_MODE"
+        for node in ast.walk(example_tree())
+    ), "Conditional logic for fast_mode not found"
+
+
+def test_configuration_documented():
+    """Test the example documents the two extraction modes."""
+    assert "CONFIGURATION: Fast Mode vs LLM Mode" in example_source()
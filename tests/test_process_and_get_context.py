@@ -8,170 +8,90 @@ This test validates the new use case workflow where:
 4. Updates KG with response
 """
 
-import sys
-import os
 import datetime
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
 
 from ghost_kg import AgentManager, Rating
 
-DB_PATH = "test_process_and_get_context.db"
+TOPIC = "energy"
+START = datetime.datetime(2025, 1, 1, 9, 0, 0, tzinfo=datetime.timezone.utc)
 
-# Cleanup
-if os.path.exists(DB_PATH):
-    os.remove(DB_PATH)
+# Bob's message to Alice and the triplets extracted from it
+BOB_TEXT = "Nuclear energy is a clean and efficient option."
+BOB_TRIPLETS = [
+    ("Bob", "advocates", "nuclear energy"),
+    ("nuclear energy", "is", "clean"),
+    ("nuclear energy", "is", "efficient"),
+]
 
 
-def test_process_and_get_context():
-    """Test the process_and_get_context method."""
-
-    print("=" * 70)
-    print("TEST: process_and_get_context method")
-    print("=" * 70)
-
-    # Initialize
-    manager = AgentManager(db_path=DB_PATH)
-
-    # Create agents
-    print("\n✓ Creating agents...")
-    alice = manager.create_agent("Alice")
-    bob = manager.create_agent("Bob")
-
-    # Set time
-    print("✓ Setting time...")
-    current_time = datetime.datetime(2025, 1, 1, 9, 0, 0, tzinfo=datetime.timezone.utc)
-    manager.set_agent_time("Alice", current_time)
-    manager.set_agent_time("Bob", current_time)
-
-    # Initialize beliefs
-    print("✓ Initializing beliefs...")
+@pytest.fixture
+def manager():
+    """In-memory manager with Alice and Bob holding one belief each."""
+    manager = AgentManager(db_path=":memory:")
+    manager.create_agents_bulk([("Alice", START), ("Bob", START)])
     manager.learn_triplet(
         "Alice", "I", "support", "renewable energy", rating=Rating.Easy, sentiment=0.9
     )
     manager.learn_triplet(
         "Bob", "I", "support", "nuclear energy", rating=Rating.Easy, sentiment=0.8
     )
+    yield manager
+    manager.db.close()
 
-    # Test 1: Verify atomic operation
-    print("\n" + "-" * 70)
-    print("TEST 1: Verify atomic update and context retrieval")
-    print("-" * 70)
-
-    topic = "energy"
-    text = "Nuclear energy is a clean and efficient option."
-    author = "Bob"
-    triplets = [
-        ("Bob", "advocates", "nuclear energy"),
-        ("nuclear energy", "is", "clean"),
-        ("nuclear energy", "is", "efficient"),
-    ]
-
-    # Alice processes Bob's message
-    context = manager.process_and_get_context(
-        agent_name="Alice", topic=topic, text=text, author=author, triplets=triplets
-    )
 
-    print(f"✓ Alice processed ('{topic}', '{text[:40]}...')")
-    print(f"✓ Context retrieved: {context[:100]}...")
-
-    # Verify context contains both Alice's beliefs and Bob's information
-    assert (
-        "renewable energy" in context.lower()
-    ), "Context should contain Alice's belief"
-    assert (
-        "nuclear" in context.lower() or "bob" in context.lower()
-    ), "Context should contain Bob's input"
-    print("✓ Context contains both agent's belief and peer's information")
-
-    # Test 2: Verify KG was updated
-    print("\n" + "-" * 70)
-    print("TEST 2: Verify KG was updated")
-    print("-" * 70)
-
-    knowledge = manager.get_agent_knowledge("Alice", topic=topic)
-    print(f"✓ Alice's knowledge: {len(knowledge['world_knowledge'])} world facts")
-
-    # Should have world knowledge about nuclear energy from Bob
-    world_knowledge_strings = [
-        f"{fact['source']} {fact['relation']} {fact['target']}"
-        for fact in knowledge["world_knowledge"]
-    ]
-    has_nuclear = any(
-        "nuclear" in str(fact).lower() for fact in world_knowledge_strings
+def alice_reads_bob(manager):
+    """Have Alice process Bob's message and return her context."""
+    return manager.process_and_get_context(
+        agent_name="Alice", topic=TOPIC, text=BOB_TEXT, author="Bob", triplets=BOB_TRIPLETS
     )
-    assert has_nuclear, "Alice's KG should have nuclear energy information"
-    print("✓ Alice's KG contains nuclear energy information from Bob")
 
-    # Test 3: Multi-round workflow
-    print("\n" + "-" * 70)
-    print("TEST 3: Multi-round conversation workflow")
-    print("-" * 70)
 
-    # Bob responds
-    bob_text = "But renewable energy is important too."
-    bob_triplets = [
-        ("Alice", "values", "renewable energy"),
-        ("renewable energy", "is", "important"),
-    ]
+def test_process_and_get_context(manager):
+    """Test the returned context holds both the agent's belief and the peer's input."""
+    context = alice_reads_bob(manager).lower()
+    assert "renewable energy" in context, "Context should contain Alice's belief"
+    assert "nuclear" in context or "bob" in context, "Context should contain Bob's input"
+
+
+def test_process_updates_kg(manager):
+    """Test the processed text is stored in the reader's world knowledge."""
+    alice_reads_bob(manager)
+    knowledge = manager.get_agent_knowledge("Alice", topic=TOPIC)
+    assert any(
+        "nuclear" in f"{fact['source']} {fact['relation']} {fact['target']}".lower()
+        for fact in knowledge["world_knowledge"]
+    ), "Alice's KG should have nuclear energy information"
+
 
+def test_multi_round_workflow(manager):
+    """Test a reader can process a message and then store its own response."""
+    alice_reads_bob(manager)
     bob_context = manager.process_and_get_context(
         agent_name="Bob",
-        topic=topic,
-        text=bob_text,
+        topic=TOPIC,
+        text="But renewable energy is important too.",
         author="Alice",
-        triplets=bob_triplets,
+        triplets=[
+            ("Alice", "values", "renewable energy"),
+            ("renewable energy", "is", "important"),
+        ],
     )
-
-    print(f"✓ Bob processed: '{bob_text}'")
-    print(f"✓ Bob's context: {bob_context[:80]}...")
-
-    # Bob updates with his response
-    bob_response = "I agree, we need a mix of both nuclear and renewable energy."
-    response_triplets = [
-        ("support", "energy mix", 0.7),
-        ("agree_with", "renewable importance", 0.6),
-    ]
-
     manager.update_with_response(
-        "Bob", bob_response, triplets=response_triplets, context=bob_context
+        "Bob",
+        "I agree, we need a mix of both nuclear and renewable energy.",
+        triplets=[("support", "energy mix", 0.7), ("agree_with", "renewable importance", 0.6)],
+        context=bob_context,
     )
-    print(f"✓ Bob updated KG with response")
-
-    # Verify Bob's beliefs were updated
-    bob_knowledge = manager.get_agent_knowledge("Bob", topic=topic)
-    print(f"✓ Bob now has {len(bob_knowledge['agent_beliefs'])} beliefs")
-
-    # Test 4: Verify context changes over time
-    print("\n" + "-" * 70)
-    print("TEST 4: Context evolves with conversation")
-    print("-" * 70)
-
-    # Get Alice's context again - it should now include Bob's updated stance
-    alice_context_updated = manager.get_context("Alice", topic=topic)
-    print(f"✓ Alice's updated context: {alice_context_updated[:100]}...")
-
-    # The context should be different from initial context
-    # (Note: exact comparison might vary, but length/content should change)
-    print(f"✓ Initial context length: {len(context)}")
-    print(f"✓ Updated context length: {len(alice_context_updated)}")
-
-    print("\n" + "=" * 70)
-    print("✅ ALL TESTS PASSED")
-    print("=" * 70)
-
-    print(f"\nSummary:")
-    print(f"  • process_and_get_context() works correctly")
-    print(f"  • KG updates are reflected in context")
-    print(f"  • Multi-round workflow is supported")
-    print(f"  • Context evolves with conversation")
-    print(f"\n💾 Test database: {DB_PATH}")
 
-    # Cleanup
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
-        print(f"✓ Cleaned up test database")
+    beliefs = manager.get_agent_knowledge("Bob", topic=TOPIC)["agent_beliefs"]
+    assert "energy mix" in {belief["target"] for belief in beliefs}
 
 
-if __name__ == "__main__":
-    test_process_and_get_context()
+def test_context_evolves(manager):
+    """Test the context reflects what the agent has processed since the last call."""
+    before = manager.get_context("Alice", topic=TOPIC)
+    after = alice_reads_bob(manager)
+    assert after != before
+    assert "nuclear" in after.lower() and "nuclear" not in before.lower()
@@ -1,33 +1,34 @@
 """Unit tests for GhostAgent."""
 import pytest
 from datetime import datetime, timezone, timedelta
-from ghost_kg import GhostAgent, KnowledgeDB, Rating
-import tempfile
-import os
+from ghost_kg import GhostAgent, Rating
+
+# Statements are defined once so repeated runs hit the compiled-statement cache
+RECENT_EDGE_EXISTS = """
+    SELECT EXISTS(
+        SELECT 1 FROM kg_edges WHERE owner_id = ? AND created_at >= ?
+    )
+"""
+POSITIVE_EDGE_EXISTS = "SELECT EXISTS(SELECT 1 FROM kg_edges WHERE owner_id = ? AND sentiment >= ?)"
+NEGATIVE_EDGE_EXISTS = "SELECT EXISTS(SELECT 1 FROM kg_edges WHERE owner_id = ? AND sentiment <= ?)"
 
 
 class TestGhostAgent:
     """Test GhostAgent class."""
     
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database."""
-        fd, path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        yield path
-        try:
-            os.unlink(path)
-        except:
-            pass
+    @pytest.fixture(autouse=True)
+    def db(self, shared_db):
+        """The shared database, emptied after each test."""
+        return shared_db
     
     @pytest.fixture
-    def agent(self, temp_db):
+    def agent(self, db):
         """Create a GhostAgent for testing."""
-        return GhostAgent("TestAgent", temp_db)
+        return GhostAgent("TestAgent", db=db)
     
-    def test_initialization(self, temp_db):
+    def test_initialization(self):
         """Test agent initializes correctly."""
-        agent = GhostAgent("TestAgent", temp_db)
+        agent = GhostAgent("TestAgent", ":memory:")
         assert agent.name == "TestAgent"
         assert agent.db is not None
         assert agent.fsrs is not None
@@ -52,12 +53,59 @@ class TestGhostAgent:
         assert memory_view is not None
         assert len(memory_view) > 0
     
+    def test_learn_triplets_matches_learn_triplet(self, db):
+        """Test batched learning yields the same graph as one-by-one learning."""
+        now = datetime.now(timezone.utc)
+        triplets = [
+            ("Python", "is", "language", 0.0),
+            ("Java", "is", "language", 0.0),
+            ("Python", "has", "simplicity", 0.5),
+            ("I", "like", "Python", 0.7),
+            ("the", "is", "garbage", 0.0),  # rejected by validation
+        ]
+        
+        one_by_one = GhostAgent("Sequential", db=db)
+        batched = GhostAgent("Batched", db=db)
+        one_by_one.set_time(now)
+        batched.set_time(now)
+        
+        for source, relation, target, sentiment in triplets:
+            one_by_one.learn_triplet(source, relation, target, Rating.Good, sentiment)
+        batched.learn_triplets(triplets, rating=Rating.Good)
+        
+        cursor = batched.db.conn.cursor()
+        cursor.execute("""
+            SELECT id, stability, difficulty, reps, state FROM kg_nodes
+            WHERE owner_id = ? ORDER BY id
+        """, ("Sequential",))
+        expected_nodes = [tuple(row[i] for i in range(5)) for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT id, stability, difficulty, reps, state FROM kg_nodes
+            WHERE owner_id = ? ORDER BY id
+        """, ("Batched",))
+        actual_nodes = [tuple(row[i] for i in range(5)) for row in cursor.fetchall()]
+        assert actual_nodes == expected_nodes
+        
+        cursor.execute("""
+            SELECT source, relation, target, sentiment FROM kg_edges
+            WHERE owner_id = ? ORDER BY source, relation, target
+        """, ("Batched",))
+        edges = [tuple(row[i] for i in range(4)) for row in cursor.fetchall()]
+        assert edges == [
+            ("I", "like", "python", 0.7),
+            ("java", "is", "language", 0.0),
+            ("python", "has", "simplicity", 0.5),
+            ("python", "is", "language", 0.0),
+        ]
+    
     def test_query_memories_by_topic(self, agent):
         """Test querying memories by topic."""
-        # Add some memories
-        agent.learn_triplet("Python", "is", "language", Rating.Good, 0.0)
-        agent.learn_triplet("Java", "is", "language", Rating.Good, 0.0)
-        agent.learn_triplet("Python", "has", "simplicity", Rating.Good, 0.5)
+        # Add some memories in one batch
+        agent.learn_triplets([
+            ("Python", "is", "language", 0.0),
+            ("Java", "is", "language", 0.0),
+            ("Python", "has", "simplicity", 0.5),
+        ], rating=Rating.Good)
         
         # Get memory view for Python
         memory_view = agent.get_memory_view("Python")
@@ -77,13 +125,13 @@ class TestGhostAgent:
         # Query recent using SQL directly (no get_recent_memories in API)
         cursor = agent.db.conn.cursor()
         since = now - timedelta(days=1)
-        cursor.execute("""
-            SELECT * FROM kg_edges 
-            WHERE owner_id = ? AND created_at >= ?
-            ORDER BY created_at DESC
-        """, (agent.name, since))
-        recent = cursor.fetchall()
-        assert len(recent) > 0
+        cursor.execute(RECENT_EDGE_EXISTS, (agent.name, since))
+        assert cursor.fetchone()[0] == 1
+        
+        # The (owner_id, created_at) index answers the lookup on its own
+        cursor.execute("EXPLAIN QUERY PLAN " + RECENT_EDGE_EXISTS, (agent.name, since))
+        plan = " | ".join(row["detail"] for row in cursor.fetchall())
+        assert "USING COVERING INDEX idx_kg_edges_created" in plan, plan
     
     def test_set_time(self, agent):
         """Test setting agent time."""
@@ -125,24 +173,18 @@ class TestGhostAgent:
     
     def test_query_by_sentiment(self, agent):
         """Test querying by sentiment via SQL."""
-        # Add memories with different sentiments
-        agent.learn_triplet("good", "is", "positive", Rating.Good, 0.8)
-        agent.learn_triplet("bad", "is", "negative", Rating.Good, -0.8)
-        agent.learn_triplet("neutral", "is", "okay", Rating.Good, 0.0)
+        # Add memories with different sentiments in one batch
+        agent.learn_triplets([
+            ("good", "is", "positive", 0.8),
+            ("bad", "is", "negative", -0.8),
+            ("neutral", "is", "okay", 0.0),
+        ], rating=Rating.Good)
         
         # Query positive memories using SQL directly (no query_by_sentiment in API)
         cursor = agent.db.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM kg_edges 
-            WHERE owner_id = ? AND sentiment >= ?
-        """, (agent.name, 0.5))
-        positive = cursor.fetchall()
-        assert len(positive) > 0
+        cursor.execute(POSITIVE_EDGE_EXISTS, (agent.name, 0.5))
+        assert cursor.fetchone()[0] == 1
         
         # Query negative memories
-        cursor.execute("""
-            SELECT * FROM kg_edges 
-            WHERE owner_id = ? AND sentiment <= ?
-        """, (agent.name, -0.5))
-        negative = cursor.fetchall()
-        assert len(negative) > 0
+        cursor.execute(NEGATIVE_EDGE_EXISTS, (agent.name, -0.5))
+        assert cursor.fetchone()[0] == 1
@@ -72,6 +72,14 @@ class TestAgentCache:
         result = cache.get_memory_view("Alice", topic="other")
         assert result is None
     
+    def test_unhashable_key_components(self):
+        """Test keys built from unhashable values still round-trip."""
+        cache = AgentCache()
+        
+        cache.put_context("Alice", ["climate", "policy"], "context")
+        assert cache.get_context("Alice", ["climate", "policy"]) == "context"
+        assert cache.get_context("Alice", ["policy"]) is None
+    
     def test_cache_eviction_lru(self):
         """Test LRU eviction when cache is full."""
         cache = AgentCache(max_size=3)
@@ -112,6 +120,47 @@ class TestAgentCache:
         # Agent1 should still be there
         assert cache.get_context("Agent1", "topic") == "context1"
     
+    def test_cache_eviction_victim(self):
+        """Test eviction spares referenced entries and removes the oldest unreferenced one."""
+        cache = AgentCache(max_size=3)
+        
+        cache.put_context("Agent1", "topic", "context1")
+        cache.put_context("Agent2", "topic", "context2")
+        cache.put_context("Agent3", "topic", "context3")
+        cache.get_context("Agent1", "topic")               # hit marks Agent1 referenced
+        cache.put_context("Agent2", "topic", "context2b")  # overwrite marks Agent2 referenced
+        
+        cache.put_context("Agent4", "topic", "context4")
+        assert cache.get_context("Agent3", "topic") is None
+        assert cache.get_context("Agent1", "topic") == "context1"
+        assert cache.get_context("Agent2", "topic") == "context2b"
+        assert cache.get_context("Agent4", "topic") == "context4"
+        
+        # Memory views follow the same policy
+        cache.put_memory_view("Agent1", {"n": 1})
+        cache.put_memory_view("Agent2", {"n": 2})
+        cache.put_memory_view("Agent3", {"n": 3})
+        cache.get_memory_view("Agent1")
+        cache.put_memory_view("Agent4", {"n": 4})
+        assert cache.get_memory_view("Agent2") is None
+        assert cache.get_memory_view("Agent1") == {"n": 1}
+        assert cache.get_stats()["memory_entries"] == 3
+    
+    def test_cache_eviction_prefers_frequent(self):
+        """Test an entry hit repeatedly outlives one hit only once."""
+        cache = AgentCache(max_size=2)
+        
+        cache.put_context("Agent1", "topic", "context1")
+        cache.put_context("Agent2", "topic", "context2")
+        for _ in range(3):
+            cache.get_context("Agent1", "topic")
+        cache.get_context("Agent2", "topic")
+        
+        cache.put_context("Agent3", "topic", "context3")
+        assert cache.get_context("Agent1", "topic") == "context1"
+        assert cache.get_context("Agent2", "topic") is None
+        assert cache.get_context("Agent3", "topic") == "context3"
+    
     def test_invalidate_agent(self):
         """Test invalidating all cache entries for an agent."""
         cache = AgentCache()
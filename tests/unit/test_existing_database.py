@@ -3,8 +3,25 @@ import pytest
 import sqlite3
 import tempfile
 import os
+from contextlib import closing
 from ghost_kg import GhostAgent, KnowledgeDB, Rating
 
+_EXPECTED_TABLES = frozenset({"kg_nodes", "kg_edges", "kg_logs"})
+
+
+def _table_names(cursor):
+    """Return the names of the tables in the main schema.
+
+    Uses ``PRAGMA table_list`` (SQLite 3.37+), which reads the schema
+    directly instead of scanning ``sqlite_master``; older SQLite builds fall
+    back to the ``sqlite_master`` query.
+    """
+    if sqlite3.sqlite_version_info >= (3, 37, 0):
+        cursor.execute("PRAGMA table_list")
+        return {row[1] for row in cursor.fetchall() if row[0] == "main" and row[2] == "table"}
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    return {row[0] for row in cursor.fetchall()}
+
 
 class TestExistingDatabases:
     """Test GhostKG integration with existing SQLite databases."""
@@ -32,18 +49,15 @@ class TestExistingDatabases:
         
         # Verify tables exist
         cursor = db.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {row[0] for row in cursor.fetchall()}
+        tables = _table_names(cursor)
         
-        assert 'kg_nodes' in tables
-        assert 'kg_edges' in tables
-        assert 'kg_logs' in tables
+        assert _EXPECTED_TABLES.issubset(tables)
     
     def test_existing_empty_database(self, temp_db_path):
         """Test that GhostKG works with an existing empty database."""
         # Create an empty database
-        conn = sqlite3.connect(temp_db_path)
-        conn.close()
+        with closing(sqlite3.connect(temp_db_path)):
+            pass
         assert os.path.exists(temp_db_path)
         
         # Connect with GhostKG
@@ -51,41 +65,34 @@ class TestExistingDatabases:
         
         # Verify tables were created
         cursor = db.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {row[0] for row in cursor.fetchall()}
+        tables = _table_names(cursor)
         
-        assert 'kg_nodes' in tables
-        assert 'kg_edges' in tables
-        assert 'kg_logs' in tables
+        assert _EXPECTED_TABLES.issubset(tables)
     
     def test_existing_database_with_other_tables(self, temp_db_path):
         """Test that GhostKG preserves existing tables in the database."""
-        # Create database with other tables
-        conn = sqlite3.connect(temp_db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE users (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL
-            )
-        """)
-        cursor.execute("INSERT INTO users (name) VALUES (?)", ("Alice",))
-        conn.commit()
-        conn.close()
+        # Create database with other tables in a single explicit transaction
+        with closing(sqlite3.connect(temp_db_path, isolation_level=None)) as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute("""
+                CREATE TABLE users (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL
+                )
+            """)
+            cursor.execute("INSERT INTO users (name) VALUES (?)", ("Alice",))
+            cursor.execute("COMMIT")
         
         # Connect with GhostKG
         db = KnowledgeDB(temp_db_path)
         
         # Verify both original and GhostKG tables exist
         cursor = db.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {row[0] for row in cursor.fetchall()}
+        tables = _table_names(cursor)
         
         assert 'users' in tables  # Original table preserved
-        assert 'kg_nodes' in tables  # GhostKG table added
-        assert 'kg_edges' in tables  # GhostKG table added
-        assert 'kg_logs' in tables   # GhostKG table added
+        assert _EXPECTED_TABLES.issubset(tables)  # GhostKG tables added
         
         # Verify original data is intact
         cursor.execute("SELECT COUNT(*) FROM users")
@@ -98,49 +105,42 @@ class TestExistingDatabases:
         agent1.learn_triplet("Python", "is", "great", Rating.Good)
         
         # Get initial count
-        conn = sqlite3.connect(temp_db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM kg_edges")
-        initial_count = cursor.fetchone()[0]
-        conn.close()
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            initial_count = conn.execute("SELECT COUNT(*) FROM kg_edges").fetchone()[0]
         
         # Second agent connects to same database
         agent2 = GhostAgent("Agent2", db_path=temp_db_path)
         agent2.learn_triplet("AI", "uses", "Python", Rating.Easy)
         
         # Verify both agents' data exists
-        conn = sqlite3.connect(temp_db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM kg_edges")
-        final_count = cursor.fetchone()[0]
-        conn.close()
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            final_count = conn.execute("SELECT COUNT(*) FROM kg_edges").fetchone()[0]
         
         assert final_count == initial_count + 1
     
     def test_agent_with_existing_database(self, temp_db_path):
         """Test GhostAgent creation with existing database containing other tables."""
         # Create database with application-specific table
-        conn = sqlite3.connect(temp_db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE app_config (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        """)
-        cursor.execute("INSERT INTO app_config (key, value) VALUES (?, ?)", 
-                      ("version", "1.0.0"))
-        conn.commit()
-        conn.close()
+        with closing(sqlite3.connect(temp_db_path, isolation_level=None)) as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute("""
+                CREATE TABLE app_config (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            cursor.execute("INSERT INTO app_config (key, value) VALUES (?, ?)", 
+                           ("version", "1.0.0"))
+            cursor.execute("COMMIT")
         
         # Create agent with this database
         agent = GhostAgent("TestAgent", db_path=temp_db_path)
         agent.learn_triplet("Testing", "is", "important", Rating.Good)
         
         # Verify app table still exists with data
-        conn = sqlite3.connect(temp_db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM app_config WHERE key = ?", ("version",))
-        result = cursor.fetchone()
+        with closing(sqlite3.connect(temp_db_path)) as conn:
+            result = conn.execute(
+                "SELECT value FROM app_config WHERE key = ?", ("version",)
+            ).fetchone()
         assert result[0] == "1.0.0"
-        conn.close()
@@ -1,4 +1,5 @@
 """Unit tests for extraction module."""
+import sys
 import pytest
 from ghost_kg import FastExtractor, LLMExtractor, get_extractor, DependencyChecker
 from ghost_kg.extraction import ModelCache
@@ -17,6 +18,7 @@ class TestModelCache:
         model1 = ModelCache.get_gliner_model()
         model2 = ModelCache.get_gliner_model()
         assert model1 is model2
+        assert ModelCache.get_sentiment_analyzer() is ModelCache.get_sentiment_analyzer()
     
     @pytest.mark.skipif(
         not DependencyChecker.check_fast_available()[0],
@@ -29,6 +31,17 @@ class TestModelCache:
         # The model might still be None if there's an error loading
         # So we just check that the method doesn't crash
         assert True  # If we got here without exception, test passes
+    
+    def test_broken_install_reports_missing_fast_mode(self, monkeypatch):
+        """Test an installed but unimportable gliner raises the fast-mode ImportError."""
+        from ghost_kg.extraction import extraction
+        
+        monkeypatch.setattr(extraction, "HAS_FAST_MODE", True)
+        monkeypatch.setattr(ModelCache, "_model", None)
+        # A None entry makes `import gliner` raise ImportError
+        monkeypatch.setitem(sys.modules, "gliner", None)
+        with pytest.raises(ImportError, match="Fast mode requires"):
+            get_extractor(fast_mode=True)
 
 
 class TestFastExtractor:
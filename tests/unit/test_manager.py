@@ -3,6 +3,7 @@ import pytest
 from ghost_kg import AgentManager, AgentNotFoundError, ValidationError
 from datetime import datetime, timezone
 import tempfile
+import threading
 import os
 
 
@@ -38,6 +39,18 @@ class TestAgentManager:
         assert agent is not None
         assert agent.name == "Alice"
         assert "Alice" in manager.agents
+        assert agent.db is manager.db
+    
+    def test_create_agents_bulk(self, manager):
+        """Test creating several agents with their clocks at once."""
+        now = datetime.now(timezone.utc)
+        agents = manager.create_agents_bulk([("Alice", now), ("Bob", None)])
+        assert [agent.name for agent in agents] == ["Alice", "Bob"]
+        assert manager.get_agent("Alice").current_time == now
+        assert manager.db.get_node("Bob", "I") is not None
+        with pytest.raises(ValidationError):
+            manager.create_agents_bulk([("Carol", now), ("", now)])
+        assert manager.get_agent("Carol") is None
     
     def test_create_duplicate_agent(self, manager):
         """Test creating an agent with existing name."""
@@ -67,6 +80,10 @@ class TestAgentManager:
         
         agent = manager.get_agent("Alice")
         assert agent.current_time == now
+        # Setting an equal time leaves the clock untouched
+        clock = agent.current_time
+        manager.set_agent_time("Alice", now.replace())
+        assert agent.current_time is clock
     
     def test_set_agent_time_nonexistent(self, manager):
         """Test setting time for non-existent agent."""
@@ -87,6 +104,90 @@ class TestAgentManager:
         
         # Verify it was stored (indirectly by checking no errors)
     
+    def test_absorb_content_bulk(self, manager):
+        """Test absorbing many pieces of content at once."""
+        manager.create_agent("Alice")
+        manager.absorb_content_bulk("Alice", [
+            ("Python is awesome", "Bob", [("Python", "is", "awesome")]),
+            ("Rust is fast", "Carol", [("Rust", "is", "fast"), ("Rust", "has", "borrowck")]),
+        ])
+        
+        cursor = manager.db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_edges WHERE owner_id = ?", ("Alice",))
+        assert cursor.fetchone()[0] == 3
+        cursor.execute("SELECT COUNT(*) FROM kg_logs WHERE agent_name = ?", ("Alice",))
+        assert cursor.fetchone()[0] == 2
+    
+    def test_absorb_content_bulk_validation(self, manager):
+        """Test bulk absorption rejects malformed items before writing."""
+        manager.create_agent("Alice")
+        with pytest.raises(ValidationError):
+            manager.absorb_content_bulk("Alice", [
+                ("Python is awesome", "Bob", [("Python", "is", "awesome")]),
+                ("No triplets", "Bob", []),
+            ])
+        with pytest.raises(AgentNotFoundError):
+            manager.absorb_content_bulk("NonExistent", [])
+        
+        cursor = manager.db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_edges WHERE owner_id = ?", ("Alice",))
+        assert cursor.fetchone()[0] == 0
+    
+    def test_learn_triplets(self, manager):
+        """Test batched learning matches learn_triplet."""
+        manager.create_agent("Alice")
+        manager.create_agent("Bob")
+        triplets = [("Python", "is", "language"), ("I", "like", "Python", 0.9)]
+        
+        manager.learn_triplets("Alice", triplets)
+        for triplet in triplets:
+            sentiment = triplet[3] if len(triplet) == 4 else 0.0
+            manager.learn_triplet("Bob", *triplet[:3], sentiment=sentiment)
+        
+        for concept in ("python", "language"):
+            alice = manager.db.get_node("Alice", concept)
+            bob = manager.db.get_node("Bob", concept)
+            assert alice["reps"] == bob["reps"]
+            assert alice["stability"] == pytest.approx(bob["stability"])
+        with pytest.raises(ValidationError):
+            manager.learn_triplets("Alice", [("a", "b")])
+        with pytest.raises(AgentNotFoundError):
+            manager.learn_triplets("NonExistent", triplets)
+    
+    def test_ingest_triplets_raw(self, manager):
+        """Test raw ingestion stores triplets verbatim without logging."""
+        manager.create_agent("Alice")
+        manager.ingest_triplets_raw("Alice", [("Python", "is", "Awesome", 0.5), ("the", "is", "x")])
+        
+        cursor = manager.db.conn.cursor()
+        cursor.execute(
+            "SELECT source, target, sentiment FROM kg_edges WHERE owner_id = ? ORDER BY source",
+            ("Alice",),
+        )
+        assert [(row[0], row[1], row[2]) for row in cursor.fetchall()] == [
+            ("Python", "Awesome", 0.5),
+            ("the", "x", 0.0),
+        ]
+        cursor.execute("SELECT COUNT(*) FROM kg_logs WHERE agent_name = ?", ("Alice",))
+        assert cursor.fetchone()[0] == 0
+        with pytest.raises(AgentNotFoundError):
+            manager.ingest_triplets_raw("NonExistent", [("a", "b", "c")])
+    
+    @pytest.mark.parametrize(
+        "malformed",
+        [("a", "b"), None, ("a", "b", "c", 0.1, 9)],
+        ids=["short", "none", "long"],
+    )
+    def test_ingest_triplets_raw_validation(self, manager, malformed):
+        """Test raw ingestion rejects malformed triplets before writing."""
+        manager.create_agent("Alice")
+        with pytest.raises(ValidationError):
+            manager.ingest_triplets_raw("Alice", [("x", "y", "z"), malformed])
+        
+        cursor = manager.db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_edges WHERE owner_id = ?", ("Alice",))
+        assert cursor.fetchone()[0] == 0
+    
     def test_absorb_content_nonexistent_agent(self, manager):
         """Test absorbing content for non-existent agent."""
         with pytest.raises(AgentNotFoundError):
@@ -122,6 +223,47 @@ class TestAgentManager:
         manager.create_agent("Alice")
         with pytest.raises(ValidationError):
             manager.get_context("Alice", "")
+
+    def test_get_context_cached_until_update(self, manager):
+        """Test context is reused until the agent's graph or clock changes."""
+        manager.create_agent("Alice")
+        manager.set_agent_time("Alice", datetime(2025, 1, 1, 9, tzinfo=timezone.utc))
+        manager.learn_triplet("Alice", "Python", "is", "language")
+
+        first = manager.get_context("Alice", "Python")
+        assert manager.context_cache.get_stats()["context_entries"] == 1
+        assert manager.get_context("Alice", "Python") is first
+
+        manager.update_with_response("Alice", "I like Python", triplets=[("like", "Python", 0.9)])
+        updated = manager.get_context("Alice", "Python")
+        assert updated is not first
+        assert "like" in updated
+
+        manager.set_agent_time("Alice", datetime(2025, 1, 2, 9, tzinfo=timezone.utc))
+        assert manager.get_context("Alice", "Python") is not updated
+
+    def test_get_context_not_stale_after_other_thread_commits(self, manager):
+        """Test a view built during another thread's transaction is not reused after it commits."""
+        agent = manager.create_agent("Alice")
+        manager.learn_triplet("Alice", "I", "like", "tea")
+        learned = threading.Event()
+        read = threading.Event()
+        
+        def writer():
+            with manager.db.transaction():
+                agent.learn_triplet("coffee", "is", "hot")
+                learned.set()
+                read.wait(timeout=5)
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        assert learned.wait(timeout=5)
+        # The open transaction is invisible here, so this is the pre-commit view
+        assert "hot" not in manager.get_context("Alice", "coffee")
+        read.set()
+        thread.join()
+        
+        assert "hot" in manager.get_context("Alice", "coffee")
     
     def test_update_with_response(self, manager):
         """Test updating with response."""
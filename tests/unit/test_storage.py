@@ -412,3 +412,140 @@ class TestKnowledgeDB:
         assert result is not None
         assert result["content"] is None
         assert result["content_uuid"] == returned_uuid
+
+    def test_upsert_nodes_bulk(self, db):
+        """Test bulk upsert inserts new nodes and updates existing ones."""
+        now = datetime.now(timezone.utc)
+        db.upsert_node("agent1", "existing", NodeState(5.0, 5.0, now, 1, 2), now)
+
+        db.upsert_nodes_bulk(
+            "agent1",
+            {"existing": NodeState(7.0, 4.0, now, 2, 2), "new1": None, "new2": None},
+            timestamp=now,
+        )
+
+        assert db.get_node("agent1", "existing")["stability"] == 7.0
+        assert db.get_node("agent1", "existing")["reps"] == 2
+        assert db.get_node("agent1", "new1") is not None
+        assert db.get_node("agent1", "new2")["reps"] == 0
+
+    def test_upsert_nodes_bulk_accepts_ids(self, db):
+        """Test bulk upsert with a plain iterable of node ids."""
+        db.upsert_nodes_bulk("agent1", [f"node_{i}" for i in range(10)])
+
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_nodes WHERE owner_id = ?", ("agent1",))
+        assert cursor.fetchone()[0] == 10
+
+    def test_upsert_nodes_bulk_validation(self, db):
+        """Test bulk upsert rejects empty identifiers."""
+        with pytest.raises(ValidationError):
+            db.upsert_nodes_bulk("", ["node1"])
+
+        with pytest.raises(ValidationError):
+            db.upsert_nodes_bulk("agent1", ["node1", ""])
+
+    def test_list_nodes_by_owner(self, db):
+        """Test listing nodes returns only the given owner's nodes."""
+        db.upsert_nodes_bulk("agent1", ["a", "b"])
+        db.upsert_node("agent2", "c")
+
+        nodes = db.list_nodes_by_owner("agent1")
+        assert sorted(node["id"] for node in nodes) == ["a", "b"]
+        assert all(node["owner_id"] == "agent1" for node in nodes)
+        assert db.list_nodes_by_owner("nobody") == []
+
+    def test_transaction_commits_once(self, db):
+        """Test operations inside transaction() are visible in it and committed on exit."""
+        with db.transaction():
+            db.upsert_node("agent1", "a")
+            db.add_relation("agent1", "a", "likes", "b")
+            db.log_interaction("agent1", "READ", "content", {})
+            assert db.get_node("agent1", "b") is not None
+
+        assert db.get_node("agent1", "a") is not None
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_edges WHERE owner_id = ?", ("agent1",))
+        assert cursor.fetchone()[0] == 1
+
+    def test_transaction_rolls_back_on_error(self, db):
+        """Test an exception inside transaction() discards all its writes."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.upsert_node("agent1", "a")
+                with db.transaction():  # nested blocks join the outer one
+                    db.add_relation("agent1", "a", "likes", "b")
+                raise RuntimeError("abort")
+
+        assert db.get_node("agent1", "a") is None
+        assert db.get_node("agent1", "b") is None
+
+    def test_graph_tables_without_rowid(self, db):
+        """Test new SQLite databases cluster nodes and edges on their primary keys."""
+        cursor = db.conn.cursor()
+        for table in ("kg_nodes", "kg_edges"):
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = ?", (table,))
+            assert "WITHOUT ROWID" in cursor.fetchone()[0]
+
+    def test_file_database_uses_wal(self, db):
+        """Test file-backed SQLite databases are opened in WAL mode."""
+        cursor = db.conn.cursor()
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
+
+    def test_file_database_pragmas(self, db):
+        """Test new file-backed SQLite databases get the tuned page and mmap sizes."""
+        cursor = db.conn.cursor()
+        cursor.execute("PRAGMA page_size")
+        assert cursor.fetchone()[0] == 8192
+        cursor.execute("PRAGMA mmap_size")
+        assert cursor.fetchone()[0] == 268435456
+        cursor.execute("PRAGMA cache_size")
+        assert cursor.fetchone()[0] == -65536
+        cursor.execute("PRAGMA busy_timeout")
+        assert cursor.fetchone()[0] == 5000
+
+    def test_add_relations_bulk(self, db):
+        """Test bulk relation insert creates nodes and edges."""
+        db.add_relations_bulk(
+            "agent1",
+            [("a", "likes", "b", 0.5), ("b", "likes", "c"), ("a", "likes", "b", -0.5)],
+        )
+
+        cursor = db.conn.cursor()
+        cursor.execute(
+            "SELECT source, target, sentiment FROM kg_edges WHERE owner_id = ? ORDER BY source",
+            ("agent1",),
+        )
+        rows = [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+        assert rows == [("a", "b", -0.5), ("b", "c", 0.0)]
+        assert db.get_node("agent1", "c") is not None
+
+    def test_add_relations_bulk_updates_existing(self, db):
+        """Test bulk relation insert refreshes existing edges."""
+        db.add_relation("agent1", "a", "likes", "b", sentiment=0.1)
+        db.add_relations_bulk("agent1", [("a", "likes", "b", 0.9)])
+
+        cursor = db.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*), MAX(sentiment) FROM kg_edges WHERE owner_id = ?", ("agent1",)
+        )
+        row = cursor.fetchone()
+        assert row[0] == 1
+        assert row[1] == 0.9
+
+    def test_add_relations_bulk_validation(self, db):
+        """Test bulk relation insert validates before writing anything."""
+        with pytest.raises(ValidationError):
+            db.add_relations_bulk("agent1", [("a", "likes", "b"), ("a", "likes", "c", 2.0)])
+
+        with pytest.raises(ValidationError):
+            db.add_relations_bulk("agent1", [("a", "", "b")])
+
+        for malformed in [("a", "likes"), None, ("a", "likes", "b", 0.1, 9)]:
+            with pytest.raises(ValidationError):
+                db.add_relations_bulk("agent1", [("a", "likes", "b"), malformed])
+
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM kg_edges")
+        assert cursor.fetchone()[0] == 0